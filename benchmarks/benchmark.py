@@ -0,0 +1,231 @@
+"""Mede tempo e memória de cada etapa do dashboard com dados sintéticos.
+
+Uso:
+    python benchmarks/benchmark.py --sizes 1000 10000 -o resultados.json
+    python benchmarks/benchmark.py --sizes 1000 10000 --baseline benchmarks/baseline.json
+
+Também mede a partida a frio (importação do pacote em um interpretador novo) e o
+tempo de uma reexecução do script, sem dados e com um snapshot do tamanho medido.
+
+Com --baseline, a execução termina com código 1 se alguma etapa ficar mais lenta
+que a referência além da tolerância (padrão: 25%).
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+# Sem o servidor do Streamlit, cada chamada st.* emite avisos de "bare mode"
+logging.disable(logging.WARNING)
+
+import cefet_dashboard.app as app
+from cefet_dashboard import aggregates, charts, data, views
+from precompute import open_file
+from synthetic_survey import generate_survey, write_survey
+
+DEFAULT_SIZES = [1000, 10000]
+
+def measure(fn, repeat=3):
+    """Tempo (melhor e mediana de `repeat` execuções) e pico de memória alocada"""
+    tempos = []
+    for _ in range(repeat):
+        inicio = time.perf_counter()
+        result = fn()
+        tempos.append(time.perf_counter() - inicio)
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, {
+        'seconds': min(tempos),
+        'seconds_median': float(np.median(tempos)),
+        'peak_mb': peak / 1024 / 1024,
+    }
+
+# Interpretador novo: mede só a importação (tempo e pico de memória residente do processo)
+IMPORT_SCRIPT = """
+import resource, time
+inicio = time.perf_counter()
+import {module}
+print(time.perf_counter() - inicio, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+def measure_import(module, repeat=3):
+    """Tempo de importação a frio de um módulo do pacote, em um processo separado"""
+    tempos, rss = [], 0
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, '-c', IMPORT_SCRIPT.format(module=module)],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.split()
+        tempos.append(float(output[0]))
+        rss = max(rss, int(output[1]))
+    return {
+        'seconds': min(tempos),
+        'seconds_median': float(np.median(tempos)),
+        'peak_mb': rss / 1024,
+    }
+
+def script_runner():
+    """Executa o streamlit_app.py como o servidor faria a cada interação"""
+    from streamlit.testing.v1 import AppTest
+    
+    script = AppTest.from_file(str(ROOT / 'streamlit_app.py'), default_timeout=600)
+    
+    def rerun():
+        script.run()
+        if script.exception:
+            raise RuntimeError(script.exception[0].value)
+    return rerun
+
+def render_section(render, dataset):
+    """Renderiza uma seção sem servidor, sem aproveitar figuras em cache"""
+    views.cached_figure.clear()
+    render(dataset)
+
+def benchmark_startup(repeat=3):
+    """Partida a frio e reexecução sem dados (independentes do tamanho da planilha)"""
+    results = []
+    print("Partida", flush=True)
+    for stage, module in [('import:app', 'cefet_dashboard.app'), ('import:views', 'cefet_dashboard.views')]:
+        stats = measure_import(module, repeat)
+        results.append({'rows': 0, 'stage': stage, **stats})
+        print(f"  {stage:<28} {stats['seconds']:>9.3f}s  {stats['peak_mb']:>9.1f} MB (RSS)", flush=True)
+    app.SNAPSHOT_PATH = None
+    _, stats = measure(script_runner(), repeat)
+    results.append({'rows': 0, 'stage': 'rerun:empty', **stats})
+    print(f"  {'rerun:empty':<28} {stats['seconds']:>9.3f}s  {stats['peak_mb']:>9.1f} MB", flush=True)
+    return results
+
+def benchmark_size(rows, workdir, fmt='xlsx', extra_columns=0, repeat=3):
+    """Executa todas as etapas para um tamanho de planilha"""
+    results = []
+    
+    def record(stage, fn, stage_repeat=repeat):
+        result, stats = measure(fn, stage_repeat)
+        results.append({'rows': rows, 'stage': stage, **stats})
+        print(f"  {stage:<28} {stats['seconds']:>9.3f}s  {stats['peak_mb']:>9.1f} MB", flush=True)
+        return result
+    
+    path = Path(workdir) / f'pesquisa_{rows}.{fmt}'
+    if not path.exists():
+        write_survey(generate_survey(rows, extra_columns=extra_columns), path)
+    print(f"{rows:,} linhas ({path.stat().st_size / 1024 / 1024:.1f} MB em disco)", flush=True)
+    
+    cache_dir = Path(workdir) / 'cache'
+    
+    def ingest_cold():
+        # Cache em disco vazio: leitura completa da planilha
+        for cached in cache_dir.glob('*.parquet'):
+            cached.unlink()
+        return data.ingest_file(open_file(path))
+    
+    data.CACHE_DIR = cache_dir
+    record('ingest_cold', ingest_cold, stage_repeat=1)
+    df = record('ingest_cached', lambda: data.ingest_file(open_file(path)))
+    
+    record('get_likert_columns', lambda: aggregates.get_likert_columns(df))
+    likert = record('decode_likert', lambda: aggregates.decode_likert(df))
+    catalog = record('build_question_catalog', lambda: aggregates.build_question_catalog(df, likert))
+    counts = record('build_aggregates', lambda: aggregates.build_aggregates(df, catalog))
+    rating_codes = record('decode_ratings', lambda: aggregates.decode_ratings(df, aggregates.rating_columns(catalog)))
+    record('rating_counts', lambda: aggregates.rating_counts(rating_codes, list(rating_codes.columns)))
+    record('build_multiselect_index', lambda: aggregates.build_multiselect_index(df, catalog))
+    record('build_filter_index', lambda: aggregates.build_filter_index(df, counts))
+    dataset = record('build_dataset', lambda: aggregates.build_dataset('benchmark', df))
+    
+    # Reexecução completa do script com o conjunto aberto de um snapshot (caches aquecidos)
+    snapshot = Path(workdir) / f'pesquisa_{rows}.snapshot'
+    aggregates.write_snapshot(dataset, snapshot)
+    app.SNAPSHOT_PATH = str(snapshot)
+    record('rerun:snapshot', script_runner())
+    app.SNAPSHOT_PATH = None
+    
+    dataset = dict(dataset, mask=None, filter_key='all')
+    
+    likert_cols = list(dataset['likert'].columns)
+    record('create_likert_chart', lambda: [charts.create_likert_chart(dataset['likert'], col, col) for col in likert_cols])
+    record('create_infrastructure_chart', lambda: charts.create_infrastructure_chart(dataset['ratings']))
+    
+    for name, render in views.SECTIONS.items():
+        stage = 'render:' + name.split(' ', 1)[-1]
+        record(stage, lambda render=render: render_section(render, dataset))
+    return results
+
+def compare(results, baseline, tolerance):
+    """Compara com a referência; retorna as etapas que ficaram mais lentas"""
+    reference = {(r['rows'], r['stage']): r for r in baseline.get('results', [])}
+    regressions = []
+    print(f"\n{'etapa':<34} {'linhas':>9} {'atual':>9} {'base':>9} {'razão':>7}")
+    for result in results:
+        ref = reference.get((result['rows'], result['stage']))
+        if ref is None or not ref['seconds']:
+            continue
+        ratio = result['seconds'] / ref['seconds']
+        flag = ' <' if ratio > 1 + tolerance else ''
+        print(f"{result['stage']:<34} {result['rows']:>9,} {result['seconds']:>8.3f}s {ref['seconds']:>8.3f}s {ratio:>6.2f}x{flag}")
+        if flag:
+            regressions.append(result)
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark das etapas do Dashboard CEFET-MG.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="Tamanhos (número de respostas)")
+    parser.add_argument('--format', choices=['xlsx', 'csv'], default='xlsx', help="Formato da planilha sintética")
+    parser.add_argument('--extra-columns', type=int, default=0, help="Questões Likert adicionais na planilha")
+    parser.add_argument('--repeat', type=int, default=3, help="Repetições por etapa (usa o melhor tempo)")
+    parser.add_argument('--workdir', help="Diretório para as planilhas geradas (reaproveitadas entre execuções)")
+    parser.add_argument('-o', '--output', help="Grava os resultados em JSON")
+    parser.add_argument('--baseline', help="JSON de referência para detectar regressões")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="Tolerância de lentidão em relação à referência")
+    args = parser.parse_args(argv)
+    
+    workdir = args.workdir or tempfile.mkdtemp(prefix='cefet_bench_')
+    os.makedirs(workdir, exist_ok=True)
+    
+    results = benchmark_startup(args.repeat)
+    for rows in args.sizes:
+        results.extend(benchmark_size(rows, workdir, args.format, args.extra_columns, args.repeat))
+    
+    report = {
+        'meta': {
+            'date': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'format': args.format,
+            'extra_columns': args.extra_columns,
+        },
+        'results': results,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2, ensure_ascii=False))
+        print(f"\nResultados gravados em {args.output}")
+    
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} etapa(s) acima da tolerância de {args.tolerance:.0%}")
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""Gera planilhas sintéticas com os cabeçalhos e vocabulários reais da pesquisa.
+
+Uso:
+    python benchmarks/synthetic_survey.py 10000 -o pesquisa_10k.xlsx
+    python benchmarks/synthetic_survey.py 1000000 -o pesquisa_1m.csv --extra-columns 250
+"""
+import argparse
+import sys
+from itertools import combinations
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cefet_dashboard.data import (
+    CURSO_COL, DATA_COL, EMPREEND_LIKERT_COLUMNS, EMPREEND_NEGOCIO_COL, ENSINO_COL, EVASAO_COL, IDADE_COL,
+    INGRESSO_COL, INTERNET_DISP_COL, INTERNET_VEL_COL, PERMANENCIA_COL, PROJETOS_COL, SOCIO_COL,
+)
+
+CURSOS = [
+    'ENGENHARIA CIVIL', 'ENGENHARIA ELÉTRICA', 'ENGENHARIA MECÂNICA', 'ENGENHARIA DE COMPUTAÇÃO',
+    'ENGENHARIA DE PRODUÇÃO CIVIL', 'ENGENHARIA AMBIENTAL E SANITÁRIA', 'ENGENHARIA DE MATERIAIS',
+    'ENGENHARIA MECATRÔNICA', 'ENGENHARIA DE TRANSPORTES', 'ADMINISTRAÇÃO', 'LETRAS',
+    'QUÍMICA TECNOLÓGICA', 'MATEMÁTICA', 'SISTEMAS DE INFORMAÇÃO',
+]
+
+MODELOS_ENSINO = ['Presencial', 'Remoto', 'Híbrido', 'Presencial, Remoto', 'Presencial, Remoto, Híbrido']
+
+LIKERT_RESPOSTAS = [
+    '1 - Discordo totalmente', '2 - Discordo parcialmente', '3 - Não concordo nem discordo',
+    '4 - Concordo parcialmente', '5 - Concordo totalmente',
+]
+
+QUALIDADE_RESPOSTAS = ['1 - Péssima', '2 - Ruim', '3 - Razoável', '4 - Boa', '5 - Excelente']
+
+AVALIACOES = ['Excelente', 'Boa', 'Razoável', 'Ruim', 'Péssima', 'Não observado']
+
+NAO_OBSERVADO = 'Não observado'
+
+CARACTERISTICAS = [
+    'Criatividade', 'Proatividade', 'Liderança', 'Trabalho em equipe', 'Resiliência',
+    'Comunicação', 'Autonomia', 'Capacidade de assumir riscos', 'Visão de oportunidades', 'Persistência',
+]
+
+ITENS_INFRAESTRUTURA = [
+    'Salas de aula', 'Laboratórios', 'Biblioteca', 'Banheiros', 'Restaurante/cantina',
+    'Espaços de convivência', 'Quadras e áreas esportivas', 'Auditórios', 'Estacionamento', 'Segurança',
+]
+
+ITENS_ACESSIBILIDADE = [
+    'Rampas de acesso', 'Elevadores', 'Banheiros adaptados', 'Piso tátil', 'Sinalização em braile',
+    'Vagas de estacionamento reservadas', 'Intérpretes de Libras',
+]
+
+PROJETOS = [
+    'Iniciação científica', 'Empresa júnior', 'Monitoria', 'Projeto de extensão',
+    'Equipe de competição', 'Centro/diretório acadêmico', 'Estágio', 'Nenhum',
+]
+
+MOTIVOS_PERMANENCIA = [
+    'Qualidade do ensino', 'Gratuidade', 'Reconhecimento da instituição', 'Professores',
+    'Localização', 'Assistência estudantil', 'Oportunidades de pesquisa',
+]
+
+MOTIVOS_EVASAO = [
+    'Dificuldade financeira', 'Distância de casa', 'Falta de flexibilidade do curso',
+    'Conciliação com o trabalho', 'Infraestrutura precária', 'Desinteresse pelo curso',
+]
+
+ALUNOS_PREFIXO = 'O quanto as seguintes características estão presentes nos(as) ALUNOS(AS) da sua Instituição de Ensino Superior?'
+PROFESSORES_PREFIXO = 'O quanto as seguintes características estão presentes nos(as) PROFESSORES(AS) da sua Instituição de Ensino Superior? Caso não saiba avaliar algum deles, marcar a opção "Não observado"'
+INFRAESTRUTURA_PREFIXO = 'Como você avalia a qualidade da infraestrutura oferecida pela sua Instituição de Ensino Superior? (no ambiente presencial)Caso não saiba avaliar algum deles (seja por desconhecer ou por não ter experienciado ensino presencial), marcar a opção "Não observado"'
+ACESSIBILIDADE_PREFIXO = 'Como você avalia a infraestrutura destinada à pessoas com deficiência na sua Instituição de Ensino Superior?'
+
+def multiselect_answers(rng, options, rows, max_options=3, sep=';'):
+    """Respostas de múltipla escolha: sorteia entre as combinações pré-montadas"""
+    combos = [sep.join(combo) for k in range(1, max_options + 1) for combo in combinations(options, k)]
+    weights = np.array([1.0 / (combo.count(sep) + 1) ** 2 for combo in combos])
+    return np.asarray(combos, dtype=object)[rng.choice(len(combos), rows, p=weights / weights.sum())]
+
+def generate_survey(rows, seed=0, extra_columns=0):
+    """DataFrame sintético com os cabeçalhos reais e respostas plausíveis"""
+    rng = np.random.default_rng(seed)
+    
+    def pick(values, missing=0.0):
+        answers = np.asarray(values, dtype=object)[rng.integers(0, len(values), rows)]
+        if missing:
+            answers[rng.random(rows) < missing] = None
+        return answers
+    
+    criacao = pd.Timestamp('2023-03-01') + pd.to_timedelta(rng.integers(0, 365 * 24 * 3600, rows), unit='s')
+    data = {
+        DATA_COL: criacao,
+        'date_modified': criacao + pd.to_timedelta(rng.integers(60, 3600, rows), unit='s'),
+        IDADE_COL: np.where(rng.random(rows) < 0.03, np.nan, np.clip(rng.normal(23, 5, rows).round(), 17, 65)),
+        CURSO_COL: pick(CURSOS),
+        INGRESSO_COL: pd.to_datetime(
+            pd.Series(rng.integers(2015, 2024, rows)).astype(str) + np.where(rng.random(rows) < 0.5, '-02-01', '-08-01')
+        ),
+        ENSINO_COL: pick(MODELOS_ENSINO),
+    }
+    for col in EMPREEND_LIKERT_COLUMNS:
+        data[col] = pick(LIKERT_RESPOSTAS, missing=0.02)
+    data[EMPREEND_NEGOCIO_COL] = pick(['Sim', 'Não'])
+    data[SOCIO_COL] = pick(['Não', 'Sim', 'Não, mas pretendo ser'])
+    for item in CARACTERISTICAS:
+        data[f'{ALUNOS_PREFIXO}{item}'] = pick(LIKERT_RESPOSTAS, missing=0.02)
+    for item in CARACTERISTICAS:
+        data[f'{PROFESSORES_PREFIXO}{item}'] = pick(LIKERT_RESPOSTAS + [NAO_OBSERVADO], missing=0.02)
+    data[PROJETOS_COL] = multiselect_answers(rng, PROJETOS, rows)
+    for item in ITENS_INFRAESTRUTURA:
+        data[f'{INFRAESTRUTURA_PREFIXO}{item}'] = pick(AVALIACOES, missing=0.02)
+    for item in ITENS_ACESSIBILIDADE:
+        data[f'{ACESSIBILIDADE_PREFIXO}{item}'] = pick(AVALIACOES, missing=0.05)
+    data[INTERNET_DISP_COL] = pick(QUALIDADE_RESPOSTAS + [NAO_OBSERVADO])
+    data[INTERNET_VEL_COL] = pick(QUALIDADE_RESPOSTAS + [NAO_OBSERVADO])
+    data[PERMANENCIA_COL] = multiselect_answers(rng, MOTIVOS_PERMANENCIA, rows)
+    data[EVASAO_COL] = multiselect_answers(rng, MOTIVOS_EVASAO, rows)
+    # Colunas extras para simular as exportações largas (centenas de questões)
+    for i in range(extra_columns):
+        data[f'{ALUNOS_PREFIXO}Característica adicional {i + 1}'] = pick(LIKERT_RESPOSTAS, missing=0.02)
+    return pd.DataFrame(data)
+
+def write_survey(df, path):
+    """Grava a planilha em .xlsx (openpyxl em modo write-only) ou .csv"""
+    path = Path(path)
+    if path.suffix.lower() == '.csv':
+        df.to_csv(path, index=False, encoding='utf-8')
+        return path
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(list(df.columns))
+    columns = [df[col].astype(object).where(df[col].notna(), None).to_numpy() for col in df.columns]
+    for row in zip(*columns):
+        sheet.append(row)
+    workbook.save(path)
+    return path
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera uma planilha sintética da pesquisa do CEFET-MG.")
+    parser.add_argument('rows', type=int, help="Número de respostas")
+    parser.add_argument('-o', '--output', required=True, help="Arquivo de saída (.xlsx ou .csv)")
+    parser.add_argument('--seed', type=int, default=0, help="Semente do gerador (padrão: 0)")
+    parser.add_argument('--extra-columns', type=int, default=0, help="Questões Likert adicionais")
+    args = parser.parse_args(argv)
+    
+    df = generate_survey(args.rows, seed=args.seed, extra_columns=args.extra_columns)
+    write_survey(df, args.output)
+    print(f"{args.output}: {len(df):,} linhas x {len(df.columns)} colunas")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
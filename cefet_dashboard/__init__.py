@@ -0,0 +1,5 @@
+"""Dashboard CEFET-MG: leitura (data), pré-processamento (aggregates), gráficos (charts) e páginas (views, app).
+
+Os módulos são importados uma vez por processo; o Streamlit reexecuta apenas o
+streamlit_app.py a cada interação. Plotly e openpyxl só são carregados quando usados.
+"""
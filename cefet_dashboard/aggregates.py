@@ -0,0 +1,728 @@
+"""Pré-processamento da pesquisa: catálogo de questões, contagens, índices de filtro e snapshots."""
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from .data import (
+    CURSO_COL, DATA_COL, DATE_COLUMNS, EMPREEND_LIKERT_COLUMNS, EMPREEND_NEGOCIO_COL, ENSINO_COL,
+    EVASAO_COL, IDADE_COL, INGRESSO_COL, MULTISELECT_COLUMNS, PERMANENCIA_COL, PROJETOS_COL,
+    SOCIO_COL, concat_column, dataset_key, frame_cache, map_columns, memory_usage,
+)
+from .profiling import instrumented_cache, profile_stage, profiled, record_cache
+from .style import CEFET_GREEN, CEFET_LIGHT_BLUE, CEFET_ORANGE, CEFET_RED, CEFET_YELLOW
+
+def extract_likert_value(text):
+    """Extrai o valor numérico de uma resposta Likert"""
+    if pd.isna(text):
+        return None
+    text_str = str(text).strip()
+    if text_str.startswith('1 -'):
+        return 1
+    elif text_str.startswith('2 -'):
+        return 2
+    elif text_str.startswith('3 -'):
+        return 3
+    elif text_str.startswith('4 -'):
+        return 4
+    elif text_str.startswith('5 -'):
+        return 5
+    return None
+
+@profiled('get_likert_columns')
+def get_likert_columns(df):
+    """Identifica colunas com escala Likert"""
+    likert_cols = []
+    for col in df.columns:
+        if df[col].dtype == 'object' or isinstance(df[col].dtype, pd.CategoricalDtype):
+            # Testa apenas os valores distintos, de forma vetorizada
+            values = pd.Series(df[col].dropna().unique()).astype(str).str.upper()
+            if values.str.contains('CONCORDO|DISCORDO', regex=True).any():
+                likert_cols.append(col)
+    return likert_cols
+
+# Regras de seção: (seção, trechos que o cabeçalho precisa conter)
+SECTION_RULES = [
+    ('alunos', ['O quanto as seguintes características estão presentes nos(as) ALUNOS(AS)']),
+    ('professores', ['O quanto as seguintes características estão presentes nos(as) PROFESSORES(AS)', 'Caso não saiba']),
+    ('acessibilidade', ['destinada à pessoas com deficiência']),
+    ('infraestrutura', ['Como você avalia a qualidade da infraestrutura oferecida', 'Caso não saiba']),
+    ('internet', ['Como você avalia a qualidade da internet oferecida']),
+]
+
+SECTION_COLUMNS = {
+    'perfil': [CURSO_COL, IDADE_COL, INGRESSO_COL, ENSINO_COL],
+    'empreendedorismo': EMPREEND_LIKERT_COLUMNS + [EMPREEND_NEGOCIO_COL, SOCIO_COL],
+    'projetos': [PROJETOS_COL],
+    'permanencia': [PERMANENCIA_COL, EVASAO_COL],
+}
+
+RATING_KEYWORDS = ['EXCELENTE', 'BOA', 'RAZOÁVEL', 'RUIM', 'PÉSSIMA']
+
+def short_label(col):
+    """Rótulo curto de exibição para um cabeçalho longo"""
+    for sep in ('"', '?'):
+        tail = col.rsplit(sep, 1)[-1].strip()
+        if sep in col and tail:
+            return tail
+    return col.replace('"', '').strip()
+
+def column_section(col):
+    """Seção do questionário à qual a coluna pertence"""
+    for section, cols in SECTION_COLUMNS.items():
+        if col in cols:
+            return section
+    for section, parts in SECTION_RULES:
+        if all(part in col for part in parts):
+            return section
+    return 'outros'
+
+def column_type(series, col, likert_cols):
+    """Tipo da questão: likert, rating, multiselect, date, numeric ou categorical"""
+    if col in likert_cols:
+        return 'likert'
+    if col in DATE_COLUMNS or pd.api.types.is_datetime64_any_dtype(series):
+        return 'date'
+    if pd.api.types.is_numeric_dtype(series):
+        return 'numeric'
+    if col in MULTISELECT_COLUMNS:
+        return 'multiselect'
+    values = pd.Series(series.dropna().unique()).astype(str).str.upper()
+    if len(values) and values.str.contains('|'.join(RATING_KEYWORDS)).mean() >= 0.5:
+        return 'rating'
+    return 'categorical'
+
+@profiled('build_question_catalog')
+def build_question_catalog(df, likert_codes):
+    """Classifica todas as colunas por tipo e seção, com rótulos curtos"""
+    likert_cols = set(likert_codes.columns)
+    catalog = {'columns': {}, 'by_type': {}, 'by_section': {}}
+    for col in df.columns:
+        info = {
+            'type': column_type(df[col], col, likert_cols),
+            'section': column_section(col),
+            'label': short_label(col),
+        }
+        catalog['columns'][col] = info
+        catalog['by_type'].setdefault(info['type'], []).append(col)
+        catalog['by_section'].setdefault(info['section'], []).append(col)
+    return catalog
+
+def catalog_columns(catalog, section=None, type=None):
+    """Colunas do catálogo filtradas por seção e/ou tipo"""
+    if section is None:
+        return list(catalog['by_type'].get(type, []))
+    cols = catalog['by_section'].get(section, [])
+    if type is None:
+        return list(cols)
+    return [col for col in cols if catalog['columns'][col]['type'] == type]
+
+def column_label(catalog, col):
+    """Rótulo curto de uma coluna do catálogo"""
+    info = catalog['columns'].get(col)
+    return info['label'] if info else short_label(col)
+
+LIKERT_LABELS = {
+    1: '1 - Discordo Totalmente',
+    2: '2 - Discordo Parcialmente',
+    3: '3 - Neutro',
+    4: '4 - Concordo Parcialmente',
+    5: '5 - Concordo Totalmente'
+}
+
+LIKERT_COLORS = {
+    1: CEFET_RED,
+    2: CEFET_ORANGE,
+    3: CEFET_YELLOW,
+    4: CEFET_LIGHT_BLUE,
+    5: CEFET_GREEN
+}
+
+def decode_likert_series(series):
+    """Converte uma coluna Likert em códigos int8 (0 = sem resposta válida)"""
+    cat = pd.Categorical(series)
+    # Decodifica apenas as categorias distintas; o último item cobre o código -1 (NaN)
+    lookup = np.array([extract_likert_value(v) or 0 for v in cat.categories] + [0], dtype=np.int8)
+    return lookup[cat.codes]
+
+@profiled('decode_likert')
+def decode_likert(df):
+    """Gera a matriz de códigos Likert (int8) para todas as colunas com respostas 1-5"""
+    cols = [
+        col for col in df.columns
+        if df[col].dtype == 'object' or isinstance(df[col].dtype, pd.CategoricalDtype)
+    ]
+    decoded = map_columns(decode_likert_series, [df[col] for col in cols])
+    codes = {col: values for col, values in zip(cols, decoded) if values.any()}
+    return pd.DataFrame(codes, index=df.index)
+
+@profiled('likert_counts')
+def likert_counts(codes, column, mask=None):
+    """Contagem de respostas por nível (1-5) a partir da matriz de códigos"""
+    if column not in codes.columns:
+        return pd.Series(dtype='int64')
+    values = codes[column].to_numpy()
+    if mask is not None:
+        values = values[mask]
+    counts = np.bincount(values, minlength=6)[1:]
+    counts = pd.Series(counts, index=range(1, 6))
+    return counts[counts > 0]
+
+@profiled('likert_summary')
+def likert_summary(codes, columns, mask=None):
+    """Distribuição, média e top-2-box de várias questões Likert em uma única contagem"""
+    values = codes[columns].to_numpy()
+    if mask is not None:
+        values = values[mask]
+    # Cada questão ocupa 6 posições (código 0 = sem resposta válida)
+    offsets = np.arange(len(columns)) * 6
+    counts = np.bincount((values + offsets).ravel(), minlength=len(columns) * 6)
+    counts = counts.reshape(len(columns), 6)[:, 1:]
+    total = counts.sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        shares = counts / total[:, None]
+    summary = pd.DataFrame(shares, index=columns, columns=range(1, 6))
+    summary['media'] = shares @ np.arange(1, 6)
+    summary['top2'] = shares[:, 3:].sum(axis=1)
+    summary['respostas'] = total
+    return summary
+
+# Tipos de coluna cujas contagens são pré-calculadas na carga
+COUNT_TYPES = ['categorical', 'multiselect', 'rating', 'numeric']
+
+@profiled('build_aggregates')
+def build_aggregates(df, catalog):
+    """Pré-calcula as contagens de todas as colunas categóricas em uma única passada"""
+    cols = [col for col, info in catalog['columns'].items() if info['type'] in COUNT_TYPES]
+    return dict(zip(cols, map_columns(count_entry, [df[col] for col in cols])))
+
+def count_entry(series):
+    """Códigos, rótulos e contagens de uma coluna"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes, labels = series.cat.codes.to_numpy(), series.cat.categories
+    else:
+        codes, labels = pd.factorize(series)
+    counts = np.bincount(codes[codes >= 0], minlength=len(labels))
+    return {'codes': codes, 'labels': labels, 'counts': counts}
+
+@profiled('count_values')
+def count_values(aggregates, col, mask=None):
+    """Equivalente a value_counts() a partir das contagens pré-calculadas"""
+    entry = aggregates.get(col)
+    if entry is None:
+        return pd.Series(dtype='int64')
+    if mask is None:
+        counts = entry['counts']
+    else:
+        codes = entry['codes'][mask]
+        counts = np.bincount(codes[codes >= 0], minlength=len(entry['labels']))
+    counts = pd.Series(counts, index=entry['labels'], name='count')
+    counts = counts[counts > 0]
+    return counts.sort_values(ascending=False, kind='stable')
+
+# Colunas categóricas disponíveis como filtro na barra lateral
+FILTER_COLUMNS = [CURSO_COL, ENSINO_COL, SOCIO_COL, IDADE_COL]
+ANO_INGRESSO = 'Ano de ingresso'
+
+@profiled('build_filter_index')
+def build_filter_index(df, aggregates):
+    """Pré-calcula uma máscara booleana por valor de cada coluna filtrável"""
+    index = {}
+    for col in FILTER_COLUMNS:
+        if col in aggregates:
+            entry = aggregates[col]
+            index[col] = {
+                label: entry['codes'] == i
+                for i, label in enumerate(entry['labels']) if entry['counts'][i] > 0
+            }
+    if INGRESSO_COL in df.columns and pd.api.types.is_datetime64_any_dtype(df[INGRESSO_COL]):
+        codes, years = pd.factorize(df[INGRESSO_COL].dt.year)
+        index[ANO_INGRESSO] = {int(year): codes == i for i, year in enumerate(years)}
+    return index
+
+@profiled('combine_filters')
+def combine_filters(index, selections):
+    """Combina as máscaras: OR entre valores de um filtro, AND entre filtros"""
+    mask = None
+    for col, values in selections.items():
+        col_mask = np.logical_or.reduce([index[col][value] for value in values])
+        mask = col_mask if mask is None else mask & col_mask
+    return mask
+
+def filter_key(selections):
+    """Chave curta que identifica a combinação de filtros (para os caches)"""
+    if not selections:
+        return 'all'
+    return hashlib.md5(repr(selections).encode()).hexdigest()
+
+def column_values(dataset, col):
+    """Valores de uma coluna restritos às linhas filtradas"""
+    series = dataset['df'][col]
+    mask = dataset['mask']
+    return series if mask is None else series[mask]
+
+
+# Separadores testados, em ordem de preferência, nas respostas de múltipla escolha
+MULTISELECT_SEPARATORS = [';', '\n', '|', ',']
+
+def detect_separator(values):
+    """Separador usado nas respostas de múltipla escolha (None se não houver)"""
+    values = pd.Series(values, dtype=object).astype(str)
+    for sep in MULTISELECT_SEPARATORS:
+        if values.str.contains(sep, regex=False).mean() >= 0.1:
+            return sep
+    return None
+
+def split_options(value, sep):
+    """Opções distintas de uma resposta, na ordem em que aparecem"""
+    parts = str(value).split(sep) if sep else [str(value)]
+    return list(dict.fromkeys(part.strip() for part in parts if part.strip()))
+
+def build_option_index(series, sep=None):
+    """Índice esparso (CSR) respondente x opção de uma coluna de múltipla escolha"""
+    cat = series.cat if isinstance(series.dtype, pd.CategoricalDtype) else pd.Categorical(series)
+    categories = cat.categories
+    codes = np.asarray(cat.codes)
+    sep = sep or detect_separator(categories)
+    
+    # Tokeniza apenas as respostas distintas
+    vocabulary = {}
+    cat_options = [[vocabulary.setdefault(opt, len(vocabulary)) for opt in split_options(value, sep)]
+                   for value in categories]
+    cat_lengths = np.array([len(opts) for opts in cat_options] + [0], dtype=np.int64)
+    cat_starts = np.concatenate([[0], np.cumsum(cat_lengths[:-1])])
+    cat_indices = np.array([i for opts in cat_options for i in opts], dtype=np.int32)
+    
+    # Expande para as linhas: o código -1 (sem resposta) aponta para o item vazio final
+    lengths = cat_lengths[codes]
+    indptr = np.concatenate([[0], np.cumsum(lengths)])
+    offsets = np.arange(indptr[-1]) - np.repeat(indptr[:-1], lengths)
+    indices = cat_indices[np.repeat(cat_starts[codes], lengths) + offsets]
+    return {
+        'options': pd.Index(list(vocabulary)),
+        'separator': sep,
+        'lengths': lengths,
+        'indptr': indptr,
+        'indices': indices,
+    }
+
+@profiled('build_multiselect_index')
+def build_multiselect_index(df, catalog):
+    """Índices de opções de todas as colunas de múltipla escolha do catálogo"""
+    cols = catalog_columns(catalog, type='multiselect')
+    return dict(zip(cols, map_columns(build_option_index, [df[col] for col in cols])))
+
+@profiled('option_counts')
+def option_counts(entry, mask=None):
+    """Contagem por opção individual (não por combinação de opções)"""
+    indices = entry['indices']
+    if mask is not None:
+        indices = indices[np.repeat(mask, entry['lengths'])]
+    counts = pd.Series(np.bincount(indices, minlength=len(entry['options'])), index=entry['options'], name='count')
+    counts = counts[counts > 0]
+    return counts.sort_values(ascending=False, kind='stable')
+
+def option_matrix(entry, mask=None):
+    """Matriz booleana densa respondente x opção"""
+    rows = len(entry['lengths'])
+    matrix = np.zeros((rows, len(entry['options'])), dtype=bool)
+    matrix[np.repeat(np.arange(rows), entry['lengths']), entry['indices']] = True
+    return matrix if mask is None else matrix[mask]
+
+@profiled('option_cooccurrence')
+def option_cooccurrence(entry, mask=None):
+    """Número de respondentes que marcaram cada par de opções"""
+    matrix = option_matrix(entry, mask).astype(np.int32)
+    return pd.DataFrame(matrix.T @ matrix, index=entry['options'], columns=entry['options'])
+
+RATING_LEVELS = ['Excelente', 'Boa', 'Razoável', 'Ruim', 'Péssima']
+
+RATING_COLORS = {
+    'Excelente': CEFET_GREEN,
+    'Boa': CEFET_LIGHT_BLUE,
+    'Razoável': CEFET_YELLOW,
+    'Ruim': CEFET_ORANGE,
+    'Péssima': CEFET_RED
+}
+
+def rating_level(value):
+    """Índice da avaliação em RATING_LEVELS (-1 se não for uma avaliação)"""
+    text = str(value).upper()
+    for i, keyword in enumerate(RATING_KEYWORDS):
+        if keyword in text:
+            return i
+    return -1
+
+@profiled('rating_counts')
+def rating_counts(codes, columns, mask=None):
+    """Contagens empilhadas (coluna x avaliação) de várias colunas em uma única contagem sobre as notas"""
+    values = codes[columns].to_numpy()
+    if mask is not None:
+        values = values[mask]
+    # Cada coluna ocupa SCORE_LEVELS posições (nota 0 = sem avaliação)
+    offsets = np.arange(len(columns)) * SCORE_LEVELS
+    counts = np.bincount((values + offsets).ravel(), minlength=len(columns) * SCORE_LEVELS)
+    # Notas 5 ... 1, na ordem de RATING_LEVELS (Excelente ... Péssima)
+    counts = counts.reshape(len(columns), SCORE_LEVELS)[:, :0:-1]
+    return pd.DataFrame(counts, index=columns, columns=RATING_LEVELS)
+
+def rating_columns(catalog):
+    """Colunas de infraestrutura e acessibilidade, processadas juntas"""
+    return catalog_columns(catalog, section='infraestrutura') + catalog_columns(catalog, section='acessibilidade')
+
+# Dimensões da matriz de contagens segmento x questão x nível (comparações por segmento)
+SEGMENT_DIMENSIONS = [CURSO_COL, ANO_INGRESSO]
+SEGMENT_NAMES = {CURSO_COL: 'Curso', ANO_INGRESSO: 'Ano de ingresso'}
+# Níveis de nota: 0 = sem resposta válida, 1-5 = escala Likert ou avaliação
+SCORE_LEVELS = 6
+CUBE_BLOCK_ROWS = 100000
+
+def decode_rating_series(series):
+    """Converte uma coluna de avaliação em notas int8 (5 = Excelente ... 1 = Péssima, 0 = sem avaliação)"""
+    cat = pd.Categorical(series)
+    # Mapeia apenas as categorias distintas; o último item cobre o código -1 (NaN)
+    levels = np.array([rating_level(v) for v in cat.categories] + [-1])
+    lookup = np.where(levels >= 0, len(RATING_LEVELS) - levels, 0).astype(np.int8)
+    return lookup[cat.codes]
+
+def decode_ratings(df, columns):
+    """Matriz de notas (int8) das colunas de avaliação"""
+    columns = list(columns)
+    decoded = map_columns(decode_rating_series, [df[col] for col in columns])
+    return pd.DataFrame(dict(zip(columns, decoded)), index=df.index)
+
+def score_matrix(likert, ratings):
+    """Notas de todas as questões Likert e de avaliação, lado a lado"""
+    return np.hstack([likert.to_numpy(dtype=np.int8), ratings.to_numpy(dtype=np.int8)])
+
+def segment_entry(df, aggregates, dim):
+    """Códigos de segmento de uma dimensão, no formato das contagens pré-calculadas"""
+    if dim != ANO_INGRESSO:
+        return aggregates.get(dim)
+    if INGRESSO_COL not in df.columns or not pd.api.types.is_datetime64_any_dtype(df[INGRESSO_COL]):
+        return None
+    codes, labels = pd.factorize(df[INGRESSO_COL].dt.year)
+    return {'codes': codes, 'labels': pd.Index(labels), 'counts': np.bincount(codes[codes >= 0], minlength=len(labels))}
+
+@profiled('segment_cube')
+def segment_cube(matrix, segments, n_segments):
+    """Conta segmento x questão x nível com uma única contagem sobre a matriz de notas"""
+    n_questions = matrix.shape[1]
+    cells = n_questions * SCORE_LEVELS
+    cube = np.zeros(n_segments * cells, dtype=np.int64)
+    offsets = np.arange(n_questions) * SCORE_LEVELS
+    # Em blocos de linhas apenas para limitar o índice temporário
+    for start in range(0, len(matrix), CUBE_BLOCK_ROWS):
+        block = matrix[start:start + CUBE_BLOCK_ROWS]
+        codes = segments[start:start + CUBE_BLOCK_ROWS]
+        valid = codes >= 0
+        index = codes[valid, None].astype(np.int64) * cells + offsets + block[valid]
+        cube += np.bincount(index.ravel(), minlength=n_segments * cells)
+    return cube.reshape(n_segments, n_questions, SCORE_LEVELS)
+
+@profiled('build_cubes')
+def build_cubes(df, likert, ratings, aggregates):
+    """Pré-calcula o cubo de contagens de cada dimensão de segmentação"""
+    matrix = score_matrix(likert, ratings)
+    cubes = {'columns': pd.Index(list(likert.columns) + list(ratings.columns)), 'dims': {}}
+    for dim in SEGMENT_DIMENSIONS:
+        entry = segment_entry(df, aggregates, dim)
+        if entry is not None:
+            cubes['dims'][dim] = {'segments': entry, 'counts': segment_cube(matrix, entry['codes'], len(entry['labels']))}
+    return cubes
+
+def merge_cubes(base, df, likert, ratings, aggregates, start):
+    """Soma aos cubos as contagens das linhas novas (a partir da posição `start`)"""
+    matrix = score_matrix(likert.iloc[start:], ratings.iloc[start:])
+    dims = {}
+    for dim, item in base['dims'].items():
+        if dim == ANO_INGRESSO:
+            entry = merge_count_entry(item['segments'], df[INGRESSO_COL].iloc[start:].dt.year)
+        else:
+            entry = aggregates[dim]
+        counts = np.zeros((len(entry['labels']),) + item['counts'].shape[1:], dtype=np.int64)
+        counts[:len(item['counts'])] = item['counts']
+        counts += segment_cube(matrix, entry['codes'][start:], len(entry['labels']))
+        dims[dim] = {'segments': entry, 'counts': counts}
+    return {'columns': base['columns'], 'dims': dims}
+
+def cube_counts(dataset, dim):
+    """Cubo de uma dimensão; com filtros ativos, recontado apenas sobre as linhas filtradas"""
+    item = dataset['cubes']['dims'][dim]
+    mask = dataset['mask']
+    if mask is None:
+        return item['counts']
+    segments = np.where(mask, item['segments']['codes'], -1)
+    matrix = score_matrix(dataset['likert'], dataset['rating_codes'])
+    return segment_cube(matrix, segments, len(item['segments']['labels']))
+
+def cube_scores(counts):
+    """Nota média (1-5) e número de respostas válidas em cada célula do cubo"""
+    valid = counts[..., 1:]
+    total = valid.sum(axis=-1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        scores = (valid * np.arange(1, SCORE_LEVELS)).sum(axis=-1) / total
+    return scores, total
+
+# Contagens de respostas ao longo do tempo, pré-agregadas por dia, semana e mês
+TIMELINE_PERIODS = {'Diária': 'D', 'Semanal': 'W-SUN', 'Mensal': 'M'}
+
+def is_date_column(df, col):
+    """Indica se a coluna existe e já foi convertida para data"""
+    return col in df.columns and pd.api.types.is_datetime64_any_dtype(df[col])
+
+@profiled('build_timeline')
+def build_timeline(df):
+    """Dia de cada resposta (código inteiro), coorte de ingresso e contagens pré-agregadas"""
+    if not is_date_column(df, DATA_COL) or not df[DATA_COL].notna().any():
+        return None
+    days = df[DATA_COL].dt.floor('D')
+    start = days.min()
+    day_codes = ((days - start) // pd.Timedelta(days=1)).fillna(-1).to_numpy(dtype=np.int32)
+    timeline = {'start': start, 'days': int(day_codes.max()) + 1, 'day_codes': day_codes, 'cohort_codes': None, 'cohorts': None}
+    if is_date_column(df, INGRESSO_COL):
+        codes, years = pd.factorize(df[INGRESSO_COL].dt.year, sort=True)
+        timeline['cohort_codes'], timeline['cohorts'] = codes, pd.Index(years.astype(int))
+    timeline['counts'], timeline['cohort_counts'] = timeline_counts(timeline)
+    return timeline
+
+@profiled('timeline_counts')
+def timeline_counts(timeline, mask=None):
+    """Respostas por período e, mês a mês, por coorte de ano de ingresso"""
+    days = timeline['day_codes']
+    cohorts = timeline['cohort_codes']
+    if mask is not None:
+        days = days[mask]
+        cohorts = None if cohorts is None else cohorts[mask]
+    index = pd.date_range(timeline['start'], periods=timeline['days'], freq='D')
+    valid = days >= 0
+    daily = pd.Series(np.bincount(days[valid], minlength=timeline['days']), index=index)
+    counts = {'D': daily}
+    for freq in ('W-SUN', 'M'):
+        # Os dias são somados por período (semanas de segunda a domingo)
+        grouped = daily.groupby(index.to_period(freq)).sum()
+        grouped.index = grouped.index.to_timestamp()
+        counts[freq] = grouped
+    if cohorts is None:
+        return counts, None
+    n_cohorts = len(timeline['cohorts'])
+    valid &= cohorts >= 0
+    matrix = np.bincount(
+        cohorts[valid] * timeline['days'] + days[valid],
+        minlength=n_cohorts * timeline['days']
+    ).reshape(n_cohorts, timeline['days'])
+    cohort_counts = pd.DataFrame(matrix.T, index=index, columns=timeline['cohorts'])
+    cohort_counts = cohort_counts.groupby(index.to_period('M')).sum()
+    cohort_counts.index = cohort_counts.index.to_timestamp()
+    return counts, cohort_counts
+
+# Campos que identificam uma resposta ao juntar ondas da pesquisa
+RESPONSE_KEY_COLUMNS = [DATA_COL, 'date_modified', CURSO_COL, IDADE_COL, INGRESSO_COL]
+
+def key_column(series):
+    """Coluna da chave com tipo estável: a compactação muda o dtype conforme a onda"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = pd.Series(np.asarray(series), index=series.index)
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series.astype('datetime64[ns]')
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        return series.astype('float64')
+    return series.astype(object)
+
+@profiled('response_keys')
+def response_keys(df):
+    """Hash de 64 bits por resposta, usado para descartar duplicatas entre ondas"""
+    columns = [col for col in RESPONSE_KEY_COLUMNS if col in df.columns] or list(df.columns)
+    keys = pd.DataFrame({col: key_column(df[col]) for col in columns})
+    return pd.util.hash_pandas_object(keys, index=False).to_numpy()
+
+def concat_frames(frames):
+    """Concatena DataFrames coluna a coluna, unificando categorias"""
+    columns = list(dict.fromkeys(col for frame in frames for col in frame.columns))
+    data = {}
+    for col in columns:
+        parts = [
+            frame[col].reset_index(drop=True) if col in frame.columns
+            else pd.Series([None] * len(frame), dtype=object)
+            for frame in frames
+        ]
+        data[col] = concat_column(parts)
+    return pd.DataFrame(data, columns=columns)
+
+@profiled('build_dataset')
+def build_dataset(digest, df):
+    """Pré-processa o conjunto: códigos Likert, catálogo, contagens e índices"""
+    likert = decode_likert(df)
+    catalog = build_question_catalog(df, likert)
+    aggregates = build_aggregates(df, catalog)
+    rating_codes = decode_ratings(df, rating_columns(catalog))
+    return {
+        'digest': digest,
+        'df': df,
+        'likert': likert,
+        'catalog': catalog,
+        'aggregates': aggregates,
+        'ratings': rating_counts(rating_codes, list(rating_codes.columns)),
+        'rating_codes': rating_codes,
+        'cubes': build_cubes(df, likert, rating_codes, aggregates),
+        'timeline': build_timeline(df),
+        'options': build_multiselect_index(df, catalog),
+        'filters': build_filter_index(df, aggregates),
+        'keys': response_keys(df),
+        'waves': 1,
+        'duplicates': 0,
+    }
+
+def merge_count_entry(entry, series):
+    """Acrescenta as linhas novas às contagens de uma coluna (rótulos novos vão ao final)"""
+    new_codes, new_labels = pd.factorize(series)
+    labels = entry['labels']
+    labels = labels.append(pd.Index(new_labels).difference(labels, sort=False))
+    lookup = labels.get_indexer(new_labels)
+    new_codes = np.where(new_codes >= 0, lookup[new_codes], -1)
+    counts = np.bincount(new_codes[new_codes >= 0], minlength=len(labels))
+    counts[:len(entry['counts'])] += entry['counts']
+    return {'codes': np.concatenate([entry['codes'], new_codes]), 'labels': labels, 'counts': counts}
+
+def merge_option_entry(entry, series):
+    """Acrescenta as linhas novas ao índice de opções, reaproveitando o vocabulário"""
+    new = build_option_index(series, entry['separator'])
+    options = entry['options'].append(new['options'].difference(entry['options'], sort=False))
+    remap = options.get_indexer(new['options'])
+    return {
+        'options': options,
+        'separator': entry['separator'],
+        'lengths': np.concatenate([entry['lengths'], new['lengths']]),
+        'indptr': np.concatenate([entry['indptr'], entry['indptr'][-1] + new['indptr'][1:]]),
+        'indices': np.concatenate([entry['indices'], remap[new['indices']]]),
+    }
+
+@profiled('merge_wave')
+def merge_wave(base, digest, wave):
+    """Junta uma nova onda ao conjunto, processando apenas as respostas inéditas"""
+    # A chave usa só colunas fixas: vale também para questionários diferentes
+    keys = response_keys(wave)
+    fresh = ~np.isin(keys, base['keys']) & ~pd.Series(keys).duplicated().to_numpy()
+    delta = wave[fresh].reset_index(drop=True)
+    duplicates = base['duplicates'] + int((~fresh).sum())
+    
+    if set(wave.columns) != set(base['df'].columns):
+        # Questionário diferente: o catálogo muda e tudo precisa ser recalculado
+        merged = build_dataset(digest, concat_frames([base['df'], delta]))
+        merged['waves'] = base['waves'] + 1
+        merged['duplicates'] = duplicates
+        return merged
+    
+    df = concat_frames([base['df'], delta[base['df'].columns]])
+    likert = pd.concat([
+        base['likert'],
+        pd.DataFrame({col: decode_likert_series(delta[col]) for col in base['likert'].columns}),
+    ], ignore_index=True)
+    aggregates = {col: merge_count_entry(entry, delta[col]) for col, entry in base['aggregates'].items()}
+    delta_codes = decode_ratings(delta, base['rating_codes'].columns)
+    ratings = base['ratings'] + rating_counts(delta_codes, list(delta_codes.columns))
+    rating_codes = pd.concat([base['rating_codes'], delta_codes], ignore_index=True)
+    options = {col: merge_option_entry(entry, delta[col]) for col, entry in base['options'].items()}
+    memoria = base['df'].attrs.get('memory_usage', {})
+    df.attrs['memory_usage'] = {
+        'antes': memoria.get('antes', 0) + wave.attrs.get('memory_usage', {}).get('antes', 0),
+        'depois': memory_usage(df),
+    }
+    return {
+        'digest': digest,
+        'df': df,
+        'likert': likert,
+        'catalog': base['catalog'],
+        'aggregates': aggregates,
+        'ratings': ratings,
+        'rating_codes': rating_codes,
+        'cubes': merge_cubes(base['cubes'], df, likert, rating_codes, aggregates, len(base['df'])),
+        # O período pode crescer nas duas pontas: a linha do tempo é refeita (operação vetorizada)
+        'timeline': build_timeline(df),
+        'options': options,
+        # As máscaras são refeitas a partir dos códigos já combinados (operação vetorizada)
+        'filters': build_filter_index(df, aggregates),
+        'keys': np.concatenate([base['keys'], keys[fresh]]),
+        'waves': base['waves'] + 1,
+        'duplicates': duplicates,
+    }
+
+def combined_digest(digests):
+    """Hash que identifica a sequência de ondas carregadas"""
+    if len(digests) == 1:
+        return digests[0]
+    return hashlib.sha256(''.join(digests).encode()).hexdigest()
+
+def structure_size(value):
+    """Bytes dos arrays e DataFrames de uma estrutura aninhada (dicts, listas, tuplas)"""
+    if isinstance(value, pd.DataFrame):
+        return memory_usage(value)
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sum(structure_size(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(structure_size(item) for item in value)
+    return 0
+
+def dataset_size(dataset):
+    """Memória do conjunto pré-processado, incluindo o DataFrame"""
+    return structure_size(dataset)
+
+def get_dataset(digests, frames):
+    """Conjunto pré-processado; cada onda nova reaproveita o resultado das anteriores"""
+    # Mesmo orçamento (LRU por bytes, TTL) dos DataFrames carregados
+    cache = frame_cache()
+    key = dataset_key(digests)
+    dataset = cache.get(key)
+    record_cache('get_dataset', dataset is not None)
+    if dataset is None:
+        with st.spinner("Processando dados..."), profile_stage('get_dataset'):
+            if len(digests) == 1:
+                dataset = build_dataset(digests[0], frames[0])
+            else:
+                base = get_dataset(digests[:-1], frames[:-1])
+                dataset = merge_wave(base, combined_digest(digests), frames[-1])
+        cache.put(key, dataset, dataset_size(dataset))
+        if len(digests) == 1 and key in cache.entries:
+            # O df do conjunto é o próprio DataFrame carregado: fica contado uma só vez
+            cache.discard(digests[0])
+    return dataset
+
+# Snapshot pré-processado aberto na inicialização (gerado por precompute.py)
+SNAPSHOT_PATH = os.environ.get('CEFET_SNAPSHOT')
+SNAPSHOT_FORMAT_VERSION = 4
+
+def write_snapshot(dataset, path):
+    """Grava o conjunto pré-processado (colunas tipadas, contagens, catálogo e índices)"""
+    path = Path(path)
+    payload = {'version': SNAPSHOT_FORMAT_VERSION, 'dataset': dataset}
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+@profiled('read_snapshot')
+def read_snapshot(path):
+    """Lê um snapshot gerado por write_snapshot (apenas arquivos de origem confiável)"""
+    with open(path, 'rb') as f:
+        payload = pickle.load(f)
+    if not isinstance(payload, dict) or payload.get('version') != SNAPSHOT_FORMAT_VERSION:
+        raise ValueError("Snapshot incompatível com esta versão do dashboard; gere-o novamente.")
+    return payload['dataset']
+
+@instrumented_cache('get_snapshot', st.cache_resource(max_entries=2, show_spinner="Abrindo snapshot..."))
+def get_snapshot(path, mtime):
+    """Snapshot em memória; recarregado quando o arquivo é modificado"""
+    return read_snapshot(path)
@@ -0,0 +1,147 @@
+"""Página principal: upload ou snapshot, seção ativa e painel de desempenho."""
+import os
+import time
+import tracemalloc
+
+import pandas as pd
+import streamlit as st
+
+from .aggregates import SNAPSHOT_PATH, get_dataset, get_snapshot
+from .data import format_bytes, frame_cache, load_data, upload_digest
+from .profiling import (
+    ADMIN_PANEL, log_event, profile_local, profile_store, record_stage, start_profile_run,
+)
+from .style import CUSTOM_CSS, FOOTER_HTML, HEADER_HTML, WELCOME_HTML
+
+def stage_table(stats):
+    """Tabela de etapas ordenada pelo tempo total"""
+    table = pd.DataFrame([
+        {
+            'Etapa': stage,
+            'Chamadas': item['calls'],
+            'Total (ms)': item['total'] * 1000,
+            'Média (ms)': item['total'] * 1000 / item['calls'],
+            'Máx. (ms)': item['max'] * 1000,
+            'Alocado': format_bytes(item['allocated']) if item['allocated'] else '-',
+        }
+        for stage, item in stats.items()
+    ])
+    if table.empty:
+        return table
+    return table.sort_values('Total (ms)', ascending=False).round(1)
+
+def summarize_records(records):
+    """Agrupa os registros da execução atual por etapa"""
+    stats = {}
+    for record in records:
+        item = stats.setdefault(record['stage'], {'calls': 0, 'total': 0.0, 'max': 0.0, 'allocated': 0})
+        item['calls'] += 1
+        item['total'] += record['seconds']
+        item['max'] = max(item['max'], record['seconds'])
+        item['allocated'] += record['allocated'] or 0
+    return stats
+
+def render_profile_panel():
+    """Painel de administração com tempos por etapa e contadores de cache"""
+    with st.sidebar.expander("⏱️ Desempenho (admin)"):
+        medir = st.checkbox(
+            "Medir memória alocada",
+            value=tracemalloc.is_tracing(),
+            help="Ativa o tracemalloc a partir da próxima execução (deixa o app mais lento)."
+        )
+        if medir and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        elif not medir and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        
+        st.markdown(f"**Esta execução** · gráficos: {format_bytes(getattr(profile_local, 'payload', 0))}")
+        st.dataframe(stage_table(summarize_records(getattr(profile_local, 'records', []))), hide_index=True, use_container_width=True)
+        
+        store = profile_store()
+        with store['lock']:
+            acumulado = stage_table(store['stages'])
+            caches = pd.DataFrame([
+                {
+                    'Cache': stage,
+                    'Acertos': item['hits'],
+                    'Faltas': item['misses'],
+                    'Taxa de acerto': f"{item['hits'] / (item['hits'] + item['misses']):.0%}",
+                }
+                for stage, item in store['caches'].items()
+            ])
+        st.markdown("**Acumulado do servidor**")
+        st.dataframe(acumulado, hide_index=True, use_container_width=True)
+        st.markdown("**Caches**")
+        st.dataframe(caches, hide_index=True, use_container_width=True)
+        cache = frame_cache()
+        st.caption(
+            f"Dados em memória: {len(cache.entries)} item(ns) (arquivos e conjuntos processados), "
+            f"{format_bytes(cache.size)} de {format_bytes(cache.max_bytes)}"
+        )
+        
+        if st.button("Zerar estatísticas"):
+            with store['lock']:
+                store['stages'].clear()
+                store['caches'].clear()
+
+def main():
+    st.set_page_config(
+        page_title="Dashboard CEFET-MG",
+        page_icon="🎓",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    start_profile_run()
+    inicio = time.perf_counter()
+    
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+    
+    # Header
+    st.markdown(HEADER_HTML, unsafe_allow_html=True)
+    
+    # Sidebar
+    with st.sidebar:
+        st.markdown("### 📁 Upload de Dados")
+        uploaded_files = st.file_uploader(
+            "Selecione o arquivo Excel ou CSV",
+            type=['xlsx', 'xls', 'csv'],
+            accept_multiple_files=True,
+            help="Faça upload do arquivo de dados do CEFET-MG. Envie novas ondas da pesquisa para juntá-las às anteriores."
+        )
+        
+        if uploaded_files:
+            st.success("✅ Arquivo carregado com sucesso!")
+        elif SNAPSHOT_PATH and os.path.exists(SNAPSHOT_PATH):
+            st.info(f"📦 Snapshot pré-processado: {os.path.basename(SNAPSHOT_PATH)}")
+    
+    # Main content
+    dataset = None
+    if uploaded_files:
+        digests = tuple(upload_digest(uploaded_file) for uploaded_file in uploaded_files)
+        frames = [load_data(uploaded_file, digest) for uploaded_file, digest in zip(uploaded_files, digests)]
+        
+        if all(frame is not None for frame in frames):
+            dataset = get_dataset(digests, frames)
+    elif SNAPSHOT_PATH and os.path.exists(SNAPSHOT_PATH):
+        try:
+            dataset = get_snapshot(SNAPSHOT_PATH, os.path.getmtime(SNAPSHOT_PATH))
+        except Exception as e:
+            st.error(f"Erro ao abrir snapshot: {str(e)}")
+    else:
+        st.markdown(WELCOME_HTML, unsafe_allow_html=True)
+    
+    if dataset is not None:
+        # Seções e gráficos (Plotly) só são importados quando há dados para exibir
+        from .report import render_report_panel
+        from .views import render_dashboard
+        render_dashboard(dataset)
+        render_report_panel(dataset)
+    
+    # Footer
+    st.markdown("---")
+    st.markdown(FOOTER_HTML, unsafe_allow_html=True)
+    
+    record_stage('rerun', time.perf_counter() - inicio, None)
+    log_event('payload', bytes=profile_local.payload)
+    if ADMIN_PANEL:
+        render_profile_panel()
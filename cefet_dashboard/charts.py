@@ -0,0 +1,298 @@
+"""Construtores das figuras Plotly (importado só quando há dados para exibir)."""
+import os
+
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.colors import sample_colorscale
+
+from .aggregates import LIKERT_COLORS, LIKERT_LABELS, RATING_COLORS, RATING_LEVELS, likert_counts
+from .profiling import profiled
+from .style import (
+    CEFET_BLUE, CEFET_DARK_BLUE, CEFET_GRAY, CEFET_GREEN, CEFET_LIGHT_BLUE, CEFET_ORANGE,
+    CEFET_PURPLE, CEFET_RED, CEFET_YELLOW,
+)
+
+# Modo enxuto dos gráficos: menos dados por figura e limite de bytes enviados por execução
+LEAN_CHARTS = os.environ.get('CEFET_LEAN_CHARTS', '1') == '1'
+# Acima disso, barras e pizzas agrupam categorias (top + "Outros" ou faixas numéricas)
+CHART_MAX_CATEGORIES = int(os.environ.get('CEFET_CHART_MAX_CATEGORIES', '40'))
+# Acima disso, séries temporais usam traço WebGL em vez de barras
+CHART_WEBGL_POINTS = int(os.environ.get('CEFET_CHART_WEBGL_POINTS', '400'))
+CHART_LABEL_CHARS = 40
+PAYLOAD_MAX_BYTES = int(os.environ.get('CEFET_PAYLOAD_MAX_KB', '4096')) * 1024
+
+# Template mínimo compartilhado (o plotly_white completo vai inteiro em cada figura)
+pio.templates['cefet'] = go.layout.Template(layout={
+    'font': {'color': '#2a3f5f'},
+    'paper_bgcolor': 'white',
+    'plot_bgcolor': 'white',
+    'colorway': [CEFET_BLUE, CEFET_LIGHT_BLUE, CEFET_GREEN, CEFET_ORANGE, CEFET_PURPLE, CEFET_RED, CEFET_YELLOW, CEFET_GRAY],
+    'xaxis': {'gridcolor': '#EBF0F8', 'zerolinecolor': '#EBF0F8', 'automargin': True},
+    'yaxis': {'gridcolor': '#EBF0F8', 'zerolinecolor': '#EBF0F8', 'automargin': True},
+})
+FIGURE_TEMPLATE = 'cefet' if LEAN_CHARTS else 'plotly_white'
+
+def truncate_label(label, size=CHART_LABEL_CHARS):
+    """Encurta um rótulo longo, terminando com reticências"""
+    label = str(label)
+    return label if len(label) <= size else label[:size - 1].rstrip() + '…'
+
+def chart_labels(labels):
+    """Rótulos enviados ao navegador: encurtados no modo enxuto, se continuarem distintos"""
+    labels = list(labels)
+    if not LEAN_CHARTS:
+        return labels
+    short = [truncate_label(label) for label in labels]
+    return short if len(set(short)) == len(set(map(str, labels))) else labels
+
+def limit_categories(counts):
+    """Agrupa as categorias além do limite: faixas para valores numéricos, "Outros" para textos"""
+    if not LEAN_CHARTS or len(counts) <= CHART_MAX_CATEGORIES:
+        return counts
+    if pd.api.types.is_numeric_dtype(counts.index):
+        bins = pd.cut(counts.index, CHART_MAX_CATEGORIES)
+        binned = counts.groupby(bins, observed=True).sum()
+        binned.index = [f"{interval.left:.0f}–{interval.right:.0f}" for interval in binned.index]
+        return binned
+    top = counts.sort_values(ascending=False)
+    outros = pd.Series([top.iloc[CHART_MAX_CATEGORIES - 1:].sum()], index=['Outros'])
+    return pd.concat([top.iloc[:CHART_MAX_CATEGORIES - 1], outros])
+
+def measured_figure(fig):
+    """Figura com o tamanho do JSON que será enviado ao navegador"""
+    return fig, (len(fig.to_json()) if fig is not None else 0)
+
+@profiled('create_likert_chart')
+def create_likert_chart(codes, column, title, mask=None):
+    """Cria gráfico de barras para questões Likert"""
+    counts = likert_counts(codes, column, mask)
+    
+    fig = go.Figure(data=[
+        go.Bar(
+            x=[LIKERT_LABELS.get(i, str(i)) for i in counts.index],
+            y=counts.values,
+            marker_color=[LIKERT_COLORS.get(i, CEFET_GRAY) for i in counts.index],
+            text=counts.values,
+            textposition='auto',
+        )
+    ])
+    
+    fig.update_layout(
+        title=title,
+        xaxis_title="Avaliação",
+        yaxis_title="Quantidade de Respostas",
+        template=FIGURE_TEMPLATE,
+        height=400,
+        showlegend=False
+    )
+    
+    return fig
+
+@profiled('create_infrastructure_chart')
+def create_infrastructure_chart(counts, title='Avaliação da Infraestrutura'):
+    """Cria gráfico de infraestrutura a partir das contagens por avaliação"""
+    counts = counts[counts.sum(axis=1) > 0]
+    if counts.empty:
+        return None
+    
+    fig = go.Figure(data=[
+        go.Bar(
+            x=chart_labels(counts.index),
+            y=counts[level],
+            name=level,
+            marker_color=RATING_COLORS[level],
+        )
+        for level in RATING_LEVELS if counts[level].any()
+    ])
+    fig.update_layout(
+        title=title,
+        xaxis_title='Item',
+        yaxis_title='Quantidade',
+        legend_title_text='Avaliação',
+        barmode='stack',
+        height=500,
+        template=FIGURE_TEMPLATE
+    )
+    return fig
+
+@profiled('create_count_bar_chart')
+def create_count_bar_chart(counts, title, axis_label, color_scale, horizontal=True, height=500):
+    """Cria gráfico de barras a partir de contagens pré-calculadas"""
+    counts = limit_categories(counts)
+    labels = chart_labels(counts.index)
+    # Modo enxuto: cor única em vez de um vetor de cores por barra
+    marker = {'color': color_scale[0]} if LEAN_CHARTS else {'color': counts.values, 'colorscale': color_scale}
+    if horizontal:
+        fig = go.Figure(go.Bar(x=counts.values, y=labels, orientation='h', marker=marker))
+        fig.update_layout(xaxis_title='Quantidade', yaxis_title=axis_label)
+    else:
+        fig = go.Figure(go.Bar(x=labels, y=counts.values, marker=marker))
+        fig.update_layout(xaxis_title=axis_label, yaxis_title='Quantidade')
+    fig.update_layout(title=title, height=height, template=FIGURE_TEMPLATE, showlegend=False)
+    return fig
+
+@profiled('create_cooccurrence_chart')
+def create_cooccurrence_chart(matrix, title):
+    """Cria mapa de calor de coocorrência entre opções de múltipla escolha"""
+    matrix = pd.DataFrame(matrix)
+    matrix.index, matrix.columns = chart_labels(matrix.index), chart_labels(matrix.columns)
+    # plotly.express só é necessário para os mapas de calor
+    import plotly.express as px
+    
+    fig = px.imshow(
+        matrix,
+        text_auto=True,
+        aspect='auto',
+        title=title,
+        color_continuous_scale=['#FFFFFF', CEFET_BLUE]
+    )
+    fig.update_layout(height=500, template=FIGURE_TEMPLATE)
+    return fig
+
+@profiled('create_pie_chart')
+def create_pie_chart(counts, title, colors, height=400):
+    """Cria gráfico de pizza a partir de contagens pré-calculadas"""
+    counts = limit_categories(counts)
+    fig = go.Figure(go.Pie(
+        values=counts.values,
+        labels=chart_labels(counts.index),
+        marker_colors=(colors * (len(counts) // len(colors) + 1))[:len(counts)],
+        sort=False
+    ))
+    fig.update_layout(title=title)
+    fig.update_layout(height=height, template=FIGURE_TEMPLATE)
+    return fig
+
+@profiled('create_likert_overview_chart')
+def create_likert_overview_chart(summary, labels, title):
+    """Cria barras divergentes (discordância à esquerda, concordância à direita) de várias questões"""
+    summary = summary[summary['respostas'] > 0].sort_values('media')
+    if summary.empty:
+        return None
+    names = [
+        f"{truncate_label(labels[col]) if LEAN_CHARTS else labels[col]} ({row['media']:.2f} · {row['top2']:.0%})"
+        for col, row in summary.iterrows()
+    ]
+    neutro = summary[3] / 2
+    # Segmentos a partir do zero: o neutro é dividido entre os dois lados
+    parts = [
+        (3, -neutro, True), (2, -summary[2], True), (1, -summary[1], True),
+        (3, neutro, False), (4, summary[4], True), (5, summary[5], True),
+    ]
+    fig = go.Figure(data=[
+        go.Bar(
+            x=values,
+            y=names,
+            name=LIKERT_LABELS[level],
+            orientation='h',
+            marker_color=LIKERT_COLORS[level],
+            legendgroup=str(level),
+            legendrank=level,
+            showlegend=legend,
+            customdata=summary[level],
+            hovertemplate='%{y}<br>' + LIKERT_LABELS[level] + ': %{customdata:.1%}<extra></extra>',
+        )
+        for level, values, legend in parts
+    ])
+    fig.update_layout(
+        title=title,
+        xaxis_title='Respostas (média · top-2-box)',
+        xaxis_tickformat='.0%',
+        barmode='relative',
+        legend_orientation='h',
+        height=max(400, 30 * len(summary) + 200),
+        template=FIGURE_TEMPLATE
+    )
+    return fig
+
+@profiled('create_segment_heatmap')
+def create_segment_heatmap(scores, title):
+    """Cria mapa de calor da nota média (1-5) por segmento e questão"""
+    scores = scores.copy()
+    scores.index, scores.columns = chart_labels(scores.index), chart_labels(scores.columns)
+    # plotly.express só é necessário para os mapas de calor
+    import plotly.express as px
+    
+    fig = px.imshow(
+        scores,
+        text_auto='.2f',
+        aspect='auto',
+        title=title,
+        zmin=1,
+        zmax=5,
+        labels={'x': 'Questão', 'y': 'Segmento', 'color': 'Nota média'},
+        color_continuous_scale=[CEFET_RED, CEFET_YELLOW, CEFET_GREEN]
+    )
+    fig.update_layout(height=max(400, 30 * len(scores) + 200), template=FIGURE_TEMPLATE)
+    return fig
+
+@profiled('create_segment_comparison_chart')
+def create_segment_comparison_chart(shares, title, labels, colors):
+    """Cria barras 100% empilhadas com a distribuição dos níveis em cada segmento"""
+    segments = chart_labels(shares.index)
+    fig = go.Figure(data=[
+        go.Bar(
+            x=shares[level],
+            y=segments,
+            name=labels[level],
+            orientation='h',
+            marker_color=colors[level],
+        )
+        for level in shares.columns
+    ])
+    fig.update_layout(
+        title=title,
+        xaxis_title='Respostas',
+        xaxis_tickformat='.0%',
+        yaxis_autorange='reversed',
+        legend_title_text='Avaliação',
+        barmode='stack',
+        height=max(400, 30 * len(shares) + 200),
+        template=FIGURE_TEMPLATE
+    )
+    return fig
+
+@profiled('create_timeline_chart')
+def create_timeline_chart(counts, title):
+    """Cria gráfico de respostas por período, com o total acumulado"""
+    if LEAN_CHARTS and len(counts) > CHART_WEBGL_POINTS:
+        # Muitos pontos: linha em WebGL em vez de uma barra por período
+        periodo = go.Scattergl(x=counts.index, y=counts.values, name='Respostas no período',
+                               mode='lines', line=dict(color=CEFET_LIGHT_BLUE))
+    else:
+        periodo = go.Bar(x=counts.index, y=counts.values, name='Respostas no período', marker_color=CEFET_LIGHT_BLUE)
+    fig = go.Figure(data=[
+        periodo,
+        go.Scatter(x=counts.index, y=counts.cumsum().values, name='Acumulado', yaxis='y2',
+                   mode='lines', line=dict(color=CEFET_BLUE, width=3)),
+    ])
+    fig.update_layout(
+        title=title,
+        xaxis_title='Período',
+        yaxis_title='Respostas',
+        yaxis2=dict(title='Acumulado', overlaying='y', side='right', showgrid=False),
+        legend_orientation='h',
+        height=450,
+        template=FIGURE_TEMPLATE
+    )
+    return fig
+
+@profiled('create_cohort_chart')
+def create_cohort_chart(cohort_counts, title):
+    """Cria barras empilhadas de respostas por mês, separadas por ano de ingresso"""
+    colors = sample_colorscale([CEFET_LIGHT_BLUE, CEFET_DARK_BLUE], max(len(cohort_counts.columns), 2))
+    fig = go.Figure(data=[
+        go.Bar(x=cohort_counts.index, y=cohort_counts[year], name=str(year), marker_color=color)
+        for year, color in zip(cohort_counts.columns, colors)
+    ])
+    fig.update_layout(
+        title=title,
+        xaxis_title='Mês da resposta',
+        yaxis_title='Respostas',
+        legend_title_text='Ingresso',
+        barmode='stack',
+        height=450,
+        template=FIGURE_TEMPLATE
+    )
+    return fig
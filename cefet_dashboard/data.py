@@ -0,0 +1,531 @@
+"""Leitura das planilhas da pesquisa: cache em disco e em memória, tipos compactos e datas."""
+import csv
+import hashlib
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from .profiling import profile_stage, profiled, record_cache
+
+# Cache em disco (Parquet) dos arquivos já convertidos, endereçado pelo conteúdo
+CACHE_DIR = Path(os.environ.get('CEFET_CACHE_DIR', Path.home() / '.cache' / 'cefet_dashboard'))
+CACHE_MAX_BYTES = int(os.environ.get('CEFET_CACHE_MAX_MB', '1024')) * 1024 * 1024
+# Incrementar sempre que o processamento na carga mudar (invalida o cache antigo)
+CACHE_FORMAT_VERSION = 5
+
+# Colunas da pesquisa usadas diretamente pelo dashboard
+CURSO_COL = 'CURSO DE GRADUAÇÃO OF'
+IDADE_COL = 'IDADE'
+DATA_COL = 'DATA CRIAÇÃO'
+INGRESSO_COL = 'Quando você ingressou na graduação?'
+ENSINO_COL = 'Qual(is) o(s) tipos de modelos de ensino você já vivenciou na sua Instituição de Ensino Superior?'
+EMPREEND_NEGOCIO_COL = 'O que você entende como empreendedorismo?Empreendedorismo é abrir o próprio negócio (empresa)'
+SOCIO_COL = 'Você é sócio(a) ou fundador(a) de alguma empresa?Response'
+PROJETOS_COL = 'Ao longo da sua graduação, quais projetos você já participou ou participa?'
+PERMANENCIA_COL = 'Quais motivos você considera que te fazem permanecer na sua Instituição de Ensino Superior?'
+EVASAO_COL = 'Quais motivos você considera que te fariam deixar (sair/transferir) a sua Instituição de Ensino Superior?'
+INTERNET_DISP_COL = 'Como você avalia a qualidade da internet oferecida pela sua Instituição de Ensino Superior? (no ambiente presencial)Caso não saiba avaliar algum deles (seja por desconhecer ou por não ter experienciado ensino presencial), marcar a opção "Não observado"Disponibilidade de acesso a internet (Wi-Fi e/ou por cabo)'
+INTERNET_VEL_COL = 'Como você avalia a qualidade da internet oferecida pela sua Instituição de Ensino Superior? (no ambiente presencial)Caso não saiba avaliar algum deles (seja por desconhecer ou por não ter experienciado ensino presencial), marcar a opção "Não observado"Velocidade do acesso sem fio (Wi-Fi)'
+
+EMPREEND_LIKERT_COLUMNS = [
+    '"O modelo/metodologia de ensino da minha Instituição de Ensino Superior contribui para que eu desenvolva postura empreendedora."',
+    '"A matriz curricular do curso contribui para o desenvolvimento da minha postura empreendedora."',
+    '"A minha Instituição de Ensino Superior oferece uma matriz curricular flexível para que eu possa me engajar em atividades extra-curriculares."'
+]
+
+MULTISELECT_COLUMNS = [PROJETOS_COL, PERMANENCIA_COL, EVASAO_COL]
+
+DATE_COLUMNS = [
+    DATA_COL,
+    'date_modified',
+    INGRESSO_COL,
+]
+
+@profiled('file_digest')
+def file_digest(file):
+    """Calcula o hash SHA-256 do conteúdo do arquivo enviado"""
+    return hashlib.sha256(file.getvalue()).hexdigest()
+
+def cache_path(digest):
+    """Caminho do arquivo Parquet correspondente ao hash"""
+    return CACHE_DIR / f"{digest}-v{CACHE_FORMAT_VERSION}.parquet"
+
+@profiled('read_cached_frame')
+def read_cached_frame(digest):
+    """Lê o DataFrame do cache em disco (memory-map), se existir"""
+    path = cache_path(digest)
+    if not path.exists():
+        return None
+    try:
+        df = pd.read_parquet(path, memory_map=True)
+    except Exception:
+        # Arquivo corrompido ou incompleto: descarta e reprocessa
+        path.unlink(missing_ok=True)
+        return None
+    # Atualiza o mtime para a política LRU
+    os.utime(path)
+    return df
+
+@profiled('write_cached_frame')
+def write_cached_frame(digest, df):
+    """Grava o DataFrame no cache em disco e aplica o limite de tamanho"""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Escrita atômica: grava em arquivo temporário e renomeia
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+        os.close(fd)
+        try:
+            df.to_parquet(tmp, index=False)
+            os.replace(tmp, cache_path(digest))
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        evict_cache()
+    except Exception:
+        # O cache é apenas uma otimização; falhas não impedem o carregamento
+        pass
+
+def evict_cache(max_bytes=None):
+    """Remove os arquivos menos usados recentemente até respeitar o limite"""
+    evict_files(CACHE_DIR.glob('*.parquet'), CACHE_MAX_BYTES if max_bytes is None else max_bytes)
+
+def evict_files(paths, max_bytes):
+    """LRU pelo mtime: apaga os arquivos mais antigos até o total caber no limite"""
+    files = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        files.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in files)
+    for _, size, path in sorted(files):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+# Processamento coluna a coluna (datas, textos, Likert, avaliações, contagens) em paralelo
+WORKERS = int(os.environ.get('CEFET_WORKERS', '0')) or min(8, os.cpu_count() or 1)
+POOL_KIND = os.environ.get('CEFET_POOL', 'thread')
+# Abaixo deste número de células (linhas x colunas), distribuir custa mais que processar
+PARALLEL_MIN_CELLS = int(os.environ.get('CEFET_PARALLEL_MIN_CELLS', '1000000'))
+
+@st.cache_resource
+def column_pool():
+    """Pool de workers compartilhado por todas as sessões"""
+    if POOL_KIND == 'process':
+        return ProcessPoolExecutor(max_workers=WORKERS)
+    return ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix='cefet-colunas')
+
+def map_columns(func, columns):
+    """Aplica func a cada coluna no pool configurado; os resultados seguem a ordem de entrada"""
+    columns = list(columns)
+    if WORKERS <= 1 or len(columns) < 2 or len(columns) * len(columns[0]) < PARALLEL_MIN_CELLS:
+        return [func(series) for series in columns]
+    return list(column_pool().map(func, columns))
+
+@profiled('normalize_object_columns')
+def normalize_object_columns(df):
+    """Converte colunas de texto com tipos mistos para string (compatível com Arrow)"""
+    df.columns = [str(col) for col in df.columns]
+    cols = [col for col in df.columns if df[col].dtype == 'object']
+    for col, series in zip(cols, map_columns(normalize_text_series, [df[col] for col in cols])):
+        df[col] = series
+    return df
+
+def normalize_text_series(series):
+    """Converte valores não textuais de uma coluna de texto para string"""
+    kind = pd.api.types.infer_dtype(series, skipna=True)
+    if kind not in ('string', 'empty'):
+        series = series.where(series.isna(), series.astype(str))
+    return series
+
+# Número de linhas lidas por bloco na leitura incremental
+CHUNK_ROWS = int(os.environ.get('CEFET_CHUNK_ROWS', '5000'))
+
+def excel_header(row):
+    """Cabeçalho da planilha com os mesmos nomes gerados por pd.read_excel"""
+    header = []
+    seen = {}
+    for i, value in enumerate(row):
+        name = f"Unnamed: {i}" if value is None else str(value)
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        header.append(name)
+    return header
+
+def iter_excel_chunks(file, chunk_rows=CHUNK_ROWS):
+    """Lê a planilha em blocos de linhas (openpyxl em modo read-only)"""
+    # Importado só quando há planilha Excel para ler
+    from openpyxl import load_workbook
+    
+    workbook = load_workbook(file, read_only=True, data_only=True)
+    try:
+        sheet = workbook.active
+        rows = sheet.iter_rows(values_only=True)
+        header = excel_header(next(rows, ()))
+        width = len(header)
+        total = max((sheet.max_row or 0) - 1, 1)
+        buffer = []
+        done = 0
+        for row in rows:
+            if all(value is None for value in row):
+                continue
+            row = tuple(row[:width]) + (None,) * (width - len(row))
+            buffer.append(row)
+            if len(buffer) == chunk_rows:
+                done += len(buffer)
+                yield pd.DataFrame.from_records(buffer, columns=header), min(done / total, 1.0)
+                buffer = []
+        if buffer or not done:
+            yield pd.DataFrame.from_records(buffer, columns=header), 1.0
+    finally:
+        workbook.close()
+
+def iter_csv_chunks(file, chunk_rows=CHUNK_ROWS):
+    """Lê o CSV em blocos de linhas, detectando o separador pela amostra inicial"""
+    data = file.getvalue()
+    sample = data[:65536].decode('utf-8-sig', errors='ignore')
+    try:
+        sep = csv.Sniffer().sniff(sample, delimiters=',;\t|').delimiter
+    except csv.Error:
+        sep = ','
+    total = max(data.count(b'\n') - 1, 1)
+    done = 0
+    reader = pd.read_csv(io.BytesIO(data), sep=sep, encoding='utf-8-sig', chunksize=chunk_rows)
+    for chunk in reader:
+        done += len(chunk)
+        yield chunk, min(done / total, 1.0)
+
+def typed_chunk(chunk, keep=()):
+    """Converte um bloco para tipos compactos: textos viram categorias"""
+    for col in chunk.columns:
+        series = chunk[col]
+        if series.dtype == 'object' and col not in keep and series.notna().any():
+            chunk[col] = normalize_text_series(series).astype('category')
+    return chunk
+
+def concat_column(parts):
+    """Junta os blocos de uma coluna, unificando categorias e tipos divergentes"""
+    filled = [part for part in parts if part.notna().any()]
+    if not filled:
+        return pd.concat(parts, ignore_index=True)
+    categorical = [isinstance(part.dtype, pd.CategoricalDtype) for part in filled]
+    if all(categorical):
+        parts = [part if part.notna().any() else part.astype('category') for part in parts]
+        return pd.Series(pd.api.types.union_categoricals(parts, ignore_order=True))
+    if any(categorical) or any(part.dtype == 'object' for part in filled):
+        # Tipos diferentes entre blocos (ex.: números e textos): tudo vira texto
+        values = pd.concat([part.astype(object) for part in parts], ignore_index=True)
+        return normalize_text_series(values)
+    dtype = filled[0].dtype
+    parts = [part if part.notna().any() else part.astype(dtype) for part in parts]
+    return pd.concat(parts, ignore_index=True)
+
+def frame_from_chunks(chunks, progress=None):
+    """Monta o DataFrame tipado a partir dos blocos, sem manter as linhas brutas"""
+    columns = {}
+    header = []
+    antes = 0
+    for chunk, fraction in chunks:
+        if not header:
+            header = list(chunk.columns)
+        antes += memory_usage(chunk)
+        chunk = typed_chunk(chunk, keep=DATE_COLUMNS)
+        for col in header:
+            columns.setdefault(col, []).append(chunk[col].reset_index(drop=True))
+        if progress is not None:
+            progress.progress(fraction, text=f"Lendo dados... {fraction:.0%}")
+    df = pd.DataFrame({col: concat_column(parts) for col, parts in columns.items()}, columns=header)
+    df.attrs['memory_usage'] = {'antes': antes}
+    return df
+
+@profiled('read_survey')
+def read_survey(file, progress=None):
+    """Lê o arquivo enviado (Excel ou CSV) em blocos para um DataFrame tipado"""
+    name = getattr(file, 'name', '').lower()
+    if name.endswith('.csv'):
+        return frame_from_chunks(iter_csv_chunks(file), progress)
+    if name.endswith('.xls'):
+        # Formato antigo não suportado pelo openpyxl: leitura completa
+        return pd.read_excel(file)
+    return frame_from_chunks(iter_excel_chunks(file), progress)
+
+# Colunas de texto com até esta fração de valores distintos viram categorias
+CATEGORY_MAX_RATIO = 0.5
+
+def memory_usage(df):
+    """Memória ocupada pelo DataFrame, em bytes (inclui o conteúdo dos textos)"""
+    return int(df.memory_usage(deep=True).sum())
+
+def compact_series(series):
+    """Versão compacta de uma coluna: categoria para textos repetidos, numéricos menores"""
+    if series.dtype == 'object':
+        if series.nunique(dropna=True) <= len(series) * CATEGORY_MAX_RATIO:
+            return series.astype('category')
+    elif isinstance(series.dtype, pd.CategoricalDtype):
+        # Leitura em blocos categoriza todo texto; textos livres (quase únicos) voltam a ser object
+        if len(series.cat.categories) > len(series) * CATEGORY_MAX_RATIO:
+            return series.astype(object)
+    elif pd.api.types.is_integer_dtype(series):
+        return pd.to_numeric(series, downcast='integer')
+    elif pd.api.types.is_float_dtype(series):
+        return pd.to_numeric(series, downcast='float')
+    return series
+
+@profiled('compact_frame')
+def compact_frame(df):
+    """Reduz a memória: categorias para textos repetidos e numéricos menores"""
+    antes = df.attrs.get('memory_usage', {}).get('antes') or memory_usage(df)
+    # Cabeçalhos longos compartilham a mesma string com as constantes do código
+    df.columns = [sys.intern(col) for col in df.columns]
+    for col, series in zip(df.columns, map_columns(compact_series, [df[col] for col in df.columns])):
+        df[col] = series
+    df.attrs['memory_usage'] = {'antes': antes, 'depois': memory_usage(df)}
+    return df
+
+def format_bytes(size):
+    """Formata um tamanho em bytes para exibição"""
+    for unit in ['B', 'KB', 'MB']:
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+@profiled('parse_dates')
+def parse_dates(df):
+    """Converte as colunas de data"""
+    cols = [col for col in DATE_COLUMNS if col in df.columns]
+    for col, series in zip(cols, map_columns(parse_date_series, [df[col] for col in cols])):
+        df[col] = series
+    return df
+
+# Formatos testados, em ordem de preferência (dia antes do mês, como nas exportações brasileiras)
+DATE_FORMATS = [
+    '%d/%m/%Y %H:%M:%S', '%d/%m/%Y %H:%M', '%d/%m/%Y',
+    '%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d',
+    '%m/%d/%Y %H:%M:%S', '%m/%d/%Y %H:%M', '%m/%d/%Y',
+    '%d-%m-%Y', '%Y/%m/%d',
+]
+DATE_SAMPLE_SIZE = 500
+# Fração mínima da amostra que o formato precisa interpretar (tolera valores inválidos)
+DATE_FORMAT_MIN_MATCH = 0.9
+
+def detect_date_format(values):
+    """Formato que interpreta mais valores da amostra (None se nenhum servir)"""
+    sample = pd.Series(pd.unique(values[:DATE_SAMPLE_SIZE * 10])).dropna().astype(str).str.strip()
+    sample = sample[sample != ''].head(DATE_SAMPLE_SIZE)
+    if sample.empty:
+        return None
+    rates = [pd.to_datetime(sample, format=fmt, errors='coerce').notna().mean() for fmt in DATE_FORMATS]
+    best = int(np.argmax(rates))
+    return DATE_FORMATS[best] if rates[best] >= DATE_FORMAT_MIN_MATCH else None
+
+# Campos numéricos de largura fixa: (nome, largura)
+DATE_FIELDS = {'%d': ('day', 2), '%m': ('month', 2), '%Y': ('year', 4), '%H': ('hour', 2), '%M': ('minute', 2), '%S': ('second', 2)}
+
+def date_layout(fmt):
+    """Posição de cada campo e dos separadores de um formato (None se a largura não for fixa)"""
+    fields, literals, pos, i = {}, [], 0, 0
+    while i < len(fmt):
+        if fmt[i] == '%':
+            if fmt[i:i + 2] not in DATE_FIELDS:
+                return None
+            name, width = DATE_FIELDS[fmt[i:i + 2]]
+            fields[name] = (pos, width)
+            pos += width
+            i += 2
+        else:
+            literals.append((pos, ord(fmt[i])))
+            pos += 1
+            i += 1
+    return fields, literals, pos
+
+def parse_fixed_dates(values, fmt):
+    """Interpreta as datas com aritmética sobre os caracteres; NaT onde o texto não segue o formato"""
+    fields, literals, width = date_layout(fmt)
+    n = len(values)
+    text = values.astype('U')
+    # Cada linha vira um vetor de códigos Unicode (UTF-32) de largura fixa
+    if text.dtype.itemsize // 4 < width:
+        return np.full(n, np.datetime64('NaT', 'ns')), np.zeros(n, dtype=bool)
+    chars = text.view(np.uint32).reshape(n, -1)[:, :width]
+    digits = chars.astype(np.int64) - ord('0')
+    valid = pd.notna(values) & (np.char.str_len(text) == width)
+    for pos, char in literals:
+        valid &= chars[:, pos] == char
+    parts = {}
+    for name, (pos, size) in fields.items():
+        part = digits[:, pos:pos + size]
+        valid &= ((part >= 0) & (part <= 9)).all(axis=1)
+        parts[name] = part @ (10 ** np.arange(size - 1, -1, -1))
+    year, month, day = parts['year'], parts['month'], parts['day']
+    valid &= (month >= 1) & (month <= 12) & (day >= 1)
+    months = ((year - 1970) * 12 + np.clip(month, 1, 12) - 1).astype('datetime64[M]')
+    start = months.astype('datetime64[D]')
+    valid &= day <= ((months + 1).astype('datetime64[D]') - start).astype(np.int64)
+    zero = np.zeros(n, dtype=np.int64)
+    hour, minute, second = parts.get('hour', zero), parts.get('minute', zero), parts.get('second', zero)
+    valid &= (hour < 24) & (minute < 60) & (second < 60)
+    seconds = hour * 3600 + minute * 60 + second
+    result = (start + (day - 1).astype('timedelta64[D]')).astype('datetime64[ns]') + seconds.astype('timedelta64[s]')
+    return np.where(valid, result, np.datetime64('NaT', 'ns')), valid
+
+def parse_date_values(values):
+    """Converte valores de data com o formato detectado uma única vez na amostra"""
+    if pd.api.types.infer_dtype(values, skipna=True) in ('datetime', 'datetime64', 'date', 'empty'):
+        # Datas já tipadas (lidas do Excel): não há texto a interpretar
+        return pd.to_datetime(values, errors='coerce')
+    fmt = detect_date_format(values)
+    if fmt is None:
+        return pd.to_datetime(values, errors='coerce', dayfirst=True, format='mixed')
+    if fmt.startswith('%Y-%m-%d') or date_layout(fmt) is None:
+        # O pandas já tem um caminho compilado para ISO 8601
+        return pd.to_datetime(values, format=fmt, errors='coerce')
+    parsed, valid = parse_fixed_dates(values, fmt)
+    # Fora da largura fixa (ex.: dia sem zero à esquerda): interpretação usual com o mesmo formato
+    rest = ~valid & pd.notna(values)
+    if rest.any():
+        text = pd.Series(values[rest]).astype(str).str.strip()
+        parsed[rest] = pd.to_datetime(text, format=fmt, errors='coerce').to_numpy()
+    return parsed
+
+def parse_date_series(series):
+    """Converte uma coluna de data (valores inválidos viram NaT)"""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Converte apenas as categorias distintas e expande pelos códigos
+        categories = pd.DatetimeIndex(parse_date_values(series.cat.categories.to_numpy(dtype=object)))
+        return pd.Series(categories.take(series.cat.codes, allow_fill=True, fill_value=pd.NaT), index=series.index)
+    return pd.Series(parse_date_values(series.to_numpy(dtype=object)), index=series.index)
+
+@profiled('ingest_file')
+def ingest_file(file, progress=None, digest=None):
+    """Lê, tipa e compacta o arquivo, usando o cache em disco quando possível"""
+    digest = digest or file_digest(file)
+    df = read_cached_frame(digest)
+    if df is not None:
+        return df
+    
+    df = read_survey(file, progress)
+    
+    df = parse_dates(df)
+    df = normalize_object_columns(df)
+    df = compact_frame(df)
+    write_cached_frame(digest, df)
+    return df
+
+# Cache em memória compartilhado entre sessões, limitado por tamanho (LRU) e idade (TTL)
+MEMORY_CACHE_MAX_BYTES = int(os.environ.get('CEFET_MEMORY_CACHE_MB', '512')) * 1024 * 1024
+MEMORY_CACHE_TTL = int(os.environ.get('CEFET_MEMORY_CACHE_TTL', '3600')) or None
+
+class BoundedCache:
+    """Cache LRU limitado pelo total de bytes, com expiração por idade (seguro entre threads)"""
+    
+    def __init__(self, max_bytes, ttl=None):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+    
+    def get(self, key):
+        with self.lock:
+            self.expire()
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            self.entries.move_to_end(key)
+            return entry[0]
+    
+    def put(self, key, value, size):
+        with self.lock:
+            if key in self.entries:
+                self.remove(key)
+            # Maior que o orçamento inteiro: fica apenas no cache em disco
+            if size > self.max_bytes:
+                return
+            self.entries[key] = (value, size, time.monotonic())
+            self.size += size
+            while self.size > self.max_bytes:
+                self.remove(next(iter(self.entries)))
+    
+    def remove(self, key):
+        _, size, _ = self.entries.pop(key)
+        self.size -= size
+    
+    def discard(self, key):
+        with self.lock:
+            if key in self.entries:
+                self.remove(key)
+    
+    def expire(self):
+        if not self.ttl:
+            return
+        limite = time.monotonic() - self.ttl
+        for key in [key for key, (_, _, created) in self.entries.items() if created < limite]:
+            self.remove(key)
+    
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+@st.cache_resource
+def frame_cache():
+    """DataFrames carregados, compartilhados por todas as sessões do servidor"""
+    return BoundedCache(MEMORY_CACHE_MAX_BYTES, MEMORY_CACHE_TTL)
+
+def dataset_key(digests):
+    """Chave, no mesmo cache, do conjunto pré-processado de uma sequência de ondas"""
+    return ('dataset', tuple(digests))
+
+def upload_digest(file):
+    """Hash do upload, calculado uma única vez por arquivo enviado na sessão"""
+    file_id = getattr(file, 'file_id', None)
+    if file_id is None:
+        return file_digest(file)
+    digests = st.session_state.setdefault('upload_digests', {})
+    if file_id not in digests:
+        digests[file_id] = file_digest(file)
+    return digests[file_id]
+
+def load_data(file, digest=None):
+    """Carrega e processa os dados do CEFET-MG (memória, depois disco, depois o arquivo)"""
+    try:
+        digest = digest or file_digest(file)
+        cache = frame_cache()
+        df = cache.get(digest)
+        if df is None:
+            # Depois do pré-processamento, o DataFrame fica só dentro do conjunto da onda
+            dataset = cache.get(dataset_key([digest]))
+            df = dataset['df'] if dataset is not None else None
+        record_cache('load_data', df is not None)
+        if df is None:
+            with profile_stage('load_data'):
+                df = read_cached_frame(digest)
+                if df is None:
+                    with st.sidebar:
+                        progress = st.progress(0.0, text="Lendo dados...")
+                    df = ingest_file(file, progress, digest)
+                    progress.empty()
+                cache.put(digest, df, memory_usage(df))
+        return df
+    except Exception as e:
+        st.error(f"Erro ao carregar arquivo: {str(e)}")
+        return None
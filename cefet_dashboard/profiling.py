@@ -0,0 +1,114 @@
+"""Instrumentação: tempo e memória por etapa, contadores de cache e logs estruturados."""
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+import streamlit as st
+
+LOG_LEVEL = os.environ.get('CEFET_LOG_LEVEL')
+ADMIN_PANEL = os.environ.get('CEFET_ADMIN') == '1'
+
+logger = logging.getLogger('cefet_dashboard')
+# O módulo pode ser recarregado pelo Streamlit ao editar o código: o handler só é adicionado uma vez
+if LOG_LEVEL and not logger.handlers:
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(LOG_LEVEL.upper())
+    logger.propagate = False
+
+@st.cache_resource
+def profile_store():
+    """Estatísticas acumuladas do processo (compartilhadas entre sessões e reexecuções)"""
+    return {'stages': {}, 'caches': {}, 'lock': threading.Lock()}
+
+# Registros da execução atual; cada sessão do Streamlit roda em sua própria thread
+profile_local = threading.local()
+
+def log_event(event, **fields):
+    """Registra um evento em uma linha JSON"""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(json.dumps({'event': event, 'time': round(time.time(), 3), **fields}, default=str))
+
+def record_stage(stage, seconds, allocated):
+    """Acumula o tempo de uma etapa e o anexa aos registros da execução atual"""
+    store = profile_store()
+    with store['lock']:
+        stats = store['stages'].setdefault(stage, {'calls': 0, 'total': 0.0, 'max': 0.0, 'allocated': 0})
+        stats['calls'] += 1
+        stats['total'] += seconds
+        stats['max'] = max(stats['max'], seconds)
+        stats['allocated'] += allocated or 0
+    records = getattr(profile_local, 'records', None)
+    if records is not None:
+        records.append({'stage': stage, 'seconds': seconds, 'allocated': allocated})
+    log_event('stage', stage=stage, seconds=round(seconds, 6), allocated=allocated)
+
+@contextmanager
+def profile_stage(stage):
+    """Mede tempo (e memória alocada, se o tracemalloc estiver ativo) de um bloco"""
+    tracing = tracemalloc.is_tracing()
+    before = tracemalloc.get_traced_memory()[0] if tracing else 0
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - inicio
+        allocated = tracemalloc.get_traced_memory()[0] - before if tracing and tracemalloc.is_tracing() else None
+        record_stage(stage, seconds, allocated)
+
+def profiled(stage):
+    """Decorador que mede cada chamada da função como uma etapa"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with profile_stage(stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def record_cache(stage, hit):
+    """Conta um acerto ou uma falta de cache"""
+    store = profile_store()
+    with store['lock']:
+        stats = store['caches'].setdefault(stage, {'hits': 0, 'misses': 0})
+        stats['hits' if hit else 'misses'] += 1
+    log_event('cache', cache=stage, hit=hit)
+
+def instrumented_cache(stage, cache):
+    """Aplica o decorador de cache do Streamlit contando acertos e faltas"""
+    def decorator(func):
+        @functools.wraps(func)
+        def body(*args, **kwargs):
+            # Só executa em uma falta de cache
+            profile_local.miss = True
+            with profile_stage(stage):
+                return func(*args, **kwargs)
+        
+        cached = cache(body)
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # Guarda o estado da chamada externa (get_dataset é recursiva)
+            previous = getattr(profile_local, 'miss', False)
+            profile_local.miss = False
+            try:
+                return cached(*args, **kwargs)
+            finally:
+                hit = not profile_local.miss
+                profile_local.miss = previous
+                record_cache(stage, hit)
+        
+        wrapper.clear = cached.clear
+        return wrapper
+    return decorator
+
+def start_profile_run():
+    """Inicia os registros de uma nova execução do script"""
+    profile_local.records = []
+    profile_local.payload = 0
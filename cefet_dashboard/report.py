@@ -0,0 +1,337 @@
+"""Relatório estático: todas as seções pré-renderizadas em um HTML autocontido, em cache por dataset."""
+import html
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+
+import streamlit as st
+from plotly.offline import get_plotlyjs
+
+from .aggregates import catalog_columns
+from .charts import create_cohort_chart, create_timeline_chart
+from .data import (
+    CACHE_DIR, CURSO_COL, EMPREEND_LIKERT_COLUMNS, EMPREEND_NEGOCIO_COL, ENSINO_COL, EVASAO_COL,
+    IDADE_COL, INTERNET_DISP_COL, INTERNET_VEL_COL, PERMANENCIA_COL, POOL_KIND, PROJETOS_COL,
+    SOCIO_COL, WORKERS, evict_files, format_bytes,
+)
+from .profiling import profiled
+from .style import REPORT_CSS
+from .views import (
+    MIN_SEGMENT_RESPONSES, SECTIONS, age_chart, business_chart, cohort_totals_chart, cooccurrence_figure,
+    count_figure, course_chart, dropout_chart, infrastructure_figure, likert_figure, likert_overview_figure,
+    option_figure, partner_chart, permanence_chart, projects_chart, segment_counts, segment_groups,
+    segment_heatmap_figure, teaching_chart, timeline_data,
+)
+
+# Relatórios gerados, endereçados pelo hash do dataset
+REPORT_DIR = Path(os.environ.get('CEFET_REPORT_DIR', CACHE_DIR / 'relatorios'))
+REPORT_MAX_BYTES = int(os.environ.get('CEFET_REPORT_MAX_MB', '256')) * 1024 * 1024
+# Incrementar sempre que o conteúdo do relatório mudar (invalida os relatórios em cache)
+REPORT_FORMAT_VERSION = 1
+
+# Seções sem widgets: visões gerais em vez de questões individuais, todos os grupos de segmentos
+def report_visao_geral(dataset):
+    """Figuras da Visão Geral"""
+    aggregates = dataset['aggregates']
+    if CURSO_COL in aggregates:
+        yield count_figure(dataset, CURSO_COL, course_chart)
+    if IDADE_COL in aggregates:
+        yield count_figure(dataset, IDADE_COL, age_chart)
+    if ENSINO_COL in aggregates:
+        yield count_figure(dataset, ENSINO_COL, teaching_chart)
+
+def report_empreendedorismo(dataset):
+    """Figuras de Empreendedorismo"""
+    for col in EMPREEND_LIKERT_COLUMNS:
+        if col in dataset['catalog']['columns']:
+            yield likert_figure(dataset, col, col.replace('"', ''))
+    if EMPREEND_NEGOCIO_COL in dataset['aggregates']:
+        yield count_figure(dataset, EMPREEND_NEGOCIO_COL, business_chart)
+    if SOCIO_COL in dataset['aggregates']:
+        yield count_figure(dataset, SOCIO_COL, partner_chart)
+
+def report_perfil_alunos(dataset):
+    """Figuras do Perfil dos Alunos"""
+    alunos_cols = catalog_columns(dataset['catalog'], section='alunos', type='likert')
+    if alunos_cols:
+        yield likert_overview_figure(dataset, alunos_cols, 'Características dos Alunos')
+    if PROJETOS_COL in dataset['options']:
+        yield option_figure(dataset, PROJETOS_COL, projects_chart)
+        yield cooccurrence_figure(dataset)
+
+def report_infraestrutura(dataset):
+    """Figuras de Infraestrutura"""
+    catalog = dataset['catalog']
+    if catalog_columns(catalog, section='infraestrutura'):
+        yield infrastructure_figure(dataset, 'infraestrutura', 'Avaliação da Infraestrutura')
+    if catalog_columns(catalog, section='acessibilidade'):
+        yield infrastructure_figure(dataset, 'acessibilidade', 'Avaliação da Acessibilidade')
+    if INTERNET_DISP_COL in catalog['columns']:
+        yield likert_figure(dataset, INTERNET_DISP_COL, 'Disponibilidade de Internet')
+    if INTERNET_VEL_COL in catalog['columns']:
+        yield likert_figure(dataset, INTERNET_VEL_COL, 'Velocidade da Internet')
+
+def report_segmentos(dataset):
+    """Mapas de calor de todos os grupos de questões, por dimensão"""
+    dims, groups = segment_groups(dataset)
+    for dim in dims:
+        counts, names = segment_counts(dataset, dim)
+        # Em uma página de curso, a dimensão Curso tem um único segmento: nada a comparar
+        if len(names) < 2:
+            continue
+        for group, columns in groups.items():
+            yield segment_heatmap_figure(dataset, dim, group, columns, counts, names)
+
+def report_linha_do_tempo(dataset):
+    """Respostas por mês e coortes por ano de ingresso"""
+    timeline = dataset['timeline']
+    if timeline is None:
+        return
+    counts, cohort_counts = timeline_data(dataset)
+    yield create_timeline_chart(counts['M'], 'Respostas por Período (Mensal)')
+    if timeline['cohorts'] is not None:
+        yield cohort_totals_chart(cohort_counts)
+        yield create_cohort_chart(cohort_counts, 'Respostas por Mês e Ano de Ingresso')
+
+def report_analises_detalhadas(dataset):
+    """Motivos de permanência e evasão e características dos professores"""
+    options = dataset['options']
+    if PERMANENCIA_COL in options:
+        yield option_figure(dataset, PERMANENCIA_COL, permanence_chart)
+    if EVASAO_COL in options:
+        yield option_figure(dataset, EVASAO_COL, dropout_chart)
+    prof_cols = catalog_columns(dataset['catalog'], section='professores', type='likert')
+    if prof_cols:
+        yield likert_overview_figure(dataset, prof_cols, 'Características dos Professores')
+
+# Mesmas seções (e na mesma ordem) do dashboard
+REPORT_SECTIONS = dict(zip(SECTIONS, [
+    report_visao_geral,
+    report_empreendedorismo,
+    report_perfil_alunos,
+    report_infraestrutura,
+    report_segmentos,
+    report_linha_do_tempo,
+    report_analises_detalhadas,
+]))
+
+def report_path(digest, segments=False):
+    """Arquivo do relatório de um dataset em cache"""
+    kind = 'cursos' if segments else 'geral'
+    return REPORT_DIR / f'{digest}_{kind}_v{REPORT_FORMAT_VERSION}.html'
+
+def report_segments(dataset):
+    """Cursos com respostas suficientes para uma página própria"""
+    index = dataset['filters'].get(CURSO_COL, {})
+    return sorted((curso for curso, mask in index.items() if mask.sum() >= MIN_SEGMENT_RESPONSES), key=str)
+
+def segment_dataset(dataset, segment):
+    """Visão do dataset restrita a um curso (None: todas as respostas)"""
+    if segment is None:
+        return dict(dataset, mask=None, filter_key='all')
+    return dict(dataset, mask=dataset['filters'][CURSO_COL][segment], filter_key=f'curso:{segment}')
+
+def figure_script(fig):
+    """Figura como JSON embutido; desenhada no navegador só quando a página é aberta"""
+    data = fig.to_json().replace('</', '<\\/')
+    return f'<script type="application/json" class="figura">{data}</script>'
+
+# Conjunto do relatório em cada processo do pool (recebido uma vez, na criação do worker)
+worker_state = {}
+
+def init_report_worker(dataset):
+    """Inicializador dos processos do pool do relatório"""
+    worker_state['dataset'] = dataset
+
+def render_section_html(section, segment, dataset=None):
+    """HTML das figuras de uma seção, para todas as respostas ou para um curso"""
+    dataset = segment_dataset(dataset or worker_state['dataset'], segment)
+    scripts = [figure_script(fig) for fig in REPORT_SECTIONS[section](dataset) if fig is not None]
+    if not scripts:
+        return ''
+    return f'<h3>{html.escape(section)}</h3>\n' + '\n'.join(scripts)
+
+def report_executor(dataset):
+    """Pool dedicado a um relatório; no modo processo, cada worker recebe o dataset uma única vez"""
+    if POOL_KIND == 'process':
+        return ProcessPoolExecutor(max_workers=WORKERS, initializer=init_report_worker, initargs=(dataset,))
+    return ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix='cefet-relatorio')
+
+REPORT_SCRIPT = """
+function desenhar(pagina) {
+    pagina.querySelectorAll('script.figura').forEach(function (dados) {
+        var div = document.createElement('div');
+        dados.replaceWith(div);
+        var fig = JSON.parse(dados.textContent);
+        Plotly.newPlot(div, fig.data, fig.layout, {responsive: true, displaylogo: false});
+    });
+}
+document.querySelectorAll('details').forEach(function (pagina) {
+    pagina.addEventListener('toggle', function () { if (pagina.open) desenhar(pagina); });
+    if (pagina.open) desenhar(pagina);
+});
+"""
+
+@profiled('build_report')
+def build_report(dataset, segments=False, progress=None):
+    """Renderiza todas as seções (e, opcionalmente, cada curso) no pool e monta o HTML"""
+    pages = [None] + (report_segments(dataset) if segments else [])
+    tasks = [(section, segment) for segment in pages for section in REPORT_SECTIONS]
+    fragments = {}
+    with report_executor(dataset) as pool:
+        shared = None if POOL_KIND == 'process' else dataset
+        futures = {pool.submit(render_section_html, section, segment, shared): (section, segment) for section, segment in tasks}
+        for done, future in enumerate(as_completed(futures), 1):
+            fragments[futures[future]] = future.result()
+            if progress is not None:
+                progress.progress(done / len(tasks), text=f"Relatório: {done}/{len(tasks)} seções")
+    
+    body = []
+    for i, segment in enumerate(pages):
+        title = 'Todas as respostas' if segment is None else f'Curso: {segment}'
+        content = '\n'.join(fragments[section, segment] for section in REPORT_SECTIONS)
+        body.append(f'<details{" open" if i == 0 else ""}>\n<summary>{html.escape(str(title))}</summary>\n{content}\n</details>')
+    gerado = datetime.now().strftime('%d/%m/%Y %H:%M')
+    return f"""<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+<meta charset="utf-8">
+<title>Relatório CEFET-MG</title>
+<style>{REPORT_CSS}</style>
+<script>{get_plotlyjs()}</script>
+</head>
+<body>
+<header>
+<h1>🎓 Relatório CEFET-MG</h1>
+<p>{len(dataset['df']):,} respostas · gerado em {gerado}</p>
+</header>
+{chr(10).join(body)}
+<script>{REPORT_SCRIPT}</script>
+</body>
+</html>
+"""
+
+def write_report(dataset, path, segments=False, progress=None):
+    """Gera o relatório e grava o arquivo de uma vez (nunca fica um HTML pela metade)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    content = build_report(dataset, segments, progress)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        # Legível por um servidor web: o relatório é feito para ser compartilhado
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return path
+
+def cache_report(dataset, path, segments=False, progress=None):
+    """Grava o relatório no diretório de cache e remove os menos usados além do limite"""
+    write_report(dataset, path, segments, progress)
+    # O relatório recém-gerado nunca é removido, mesmo sozinho acima do limite
+    others = [p for p in REPORT_DIR.glob('*.html') if p != path]
+    evict_files(others, REPORT_MAX_BYTES - path.stat().st_size)
+    return path
+
+def report_size(path):
+    """Tamanho do relatório em cache, ou None se ainda não existe (ou já foi removido)"""
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return None
+
+def touch_report(path):
+    """Marca o relatório como baixado agora (mtime usado pela política LRU)"""
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        pass
+
+def read_report(path):
+    """Conteúdo do relatório em cache, ou None se já foi removido"""
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+class ReportJob:
+    """Geração em segundo plano (mesma interface de st.progress, consultada a cada execução)"""
+    
+    def __init__(self):
+        self.value = 0.0
+        self.text = None
+        self.future = None
+    
+    def progress(self, value, text=None):
+        self.value = value
+        self.text = text
+    
+    def running(self):
+        return self.future is not None and not self.future.done()
+
+@st.cache_resource
+def report_jobs():
+    """Relatórios em geração, por arquivo (compartilhados entre sessões)"""
+    runner = ThreadPoolExecutor(max_workers=1, thread_name_prefix='cefet-relatorios')
+    return {'lock': threading.Lock(), 'jobs': {}, 'runner': runner}
+
+def report_job(path):
+    """Job mais recente de um relatório, se houver"""
+    store = report_jobs()
+    with store['lock']:
+        return store['jobs'].get(path)
+
+def start_report(dataset, segments=False):
+    """Agenda a geração do relatório, sem bloquear a execução do script"""
+    path = report_path(dataset['digest'], segments)
+    store = report_jobs()
+    with store['lock']:
+        job = store['jobs'].get(path)
+        if job is None or (not job.running() and not path.exists()):
+            job = ReportJob()
+            job.future = store['runner'].submit(cache_report, dataset, path, segments, job)
+            store['jobs'][path] = job
+    return job
+
+def render_report_panel(dataset):
+    """Barra lateral: gera o relatório em segundo plano e oferece o HTML para download"""
+    with st.sidebar:
+        st.markdown("### 📄 Relatório estático")
+        segments = st.checkbox(
+            "Incluir uma página por curso",
+            key='relatorio_cursos',
+            help="Todas as seções, sem filtros, para o conjunto completo e para cada curso."
+        )
+        path = report_path(dataset['digest'], segments)
+        job = report_job(path)
+        size = report_size(path)
+        
+        if size is None and (job is None or not job.running()):
+            if job is not None and job.future.exception() is not None:
+                st.error(f"Erro ao gerar relatório: {job.future.exception()}")
+            if st.button("Gerar relatório"):
+                job = start_report(dataset, segments)
+        
+        if size is not None:
+            # O HTML (vários MB) só é lido quando o download é solicitado
+            if st.button("Preparar download", key='relatorio_preparar'):
+                st.session_state['relatorio_download'] = path
+                touch_report(path)
+            content = read_report(path) if st.session_state.get('relatorio_download') == path else None
+            if content is not None:
+                st.download_button(
+                    "⬇️ Baixar relatório (HTML)",
+                    data=content,
+                    file_name=f"relatorio_cefet_mg{'_cursos' if segments else ''}.html",
+                    mime='text/html'
+                )
+            st.caption(f"HTML autocontido · {format_bytes(size)}")
+        elif job is not None and job.running():
+            st.progress(job.value, text=job.text or "Gerando em segundo plano...")
+            st.button("Atualizar", key='relatorio_atualizar')
@@ -0,0 +1,216 @@
+"""Cores e trechos de HTML/CSS estáticos do dashboard (montados uma vez por processo)."""
+
+# Cores personalizadas
+CEFET_BLUE = "#003366"
+CEFET_DARK_BLUE = "#001a33"
+CEFET_LIGHT_BLUE = "#4A90E2"
+CEFET_GREEN = "#28A745"
+CEFET_YELLOW = "#FFC107"
+CEFET_ORANGE = "#FD7E14"
+CEFET_RED = "#DC3545"
+CEFET_PURPLE = "#6B5B95"
+CEFET_GRAY = "#6C757D"
+
+CUSTOM_CSS = """
+<style>
+    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
+    
+    * {
+        font-family: 'Inter', sans-serif;
+    }
+    
+    .main {
+        background: #F5F7FA;
+    }
+    
+    .header-gradient {
+        background: linear-gradient(135deg, """ + CEFET_BLUE + """ 0%, """ + CEFET_DARK_BLUE + """ 100%);
+        padding: 40px;
+        border-radius: 20px;
+        margin-bottom: 30px;
+        box-shadow: 0 10px 30px rgba(0,0,0,0.15);
+        position: relative;
+        overflow: hidden;
+    }
+    
+    .header-gradient::before {
+        content: '';
+        position: absolute;
+        top: -50%;
+        right: -10%;
+        width: 400px;
+        height: 400px;
+        background: rgba(255,255,255,0.1);
+        border-radius: 50%;
+    }
+    
+    .header-gradient h1 {
+        color: white;
+        margin: 0;
+        font-size: 42px;
+        font-weight: 700;
+        text-shadow: 2px 2px 4px rgba(0,0,0,0.2);
+    }
+    
+    .header-gradient p {
+        color: rgba(255,255,255,0.95);
+        font-size: 18px;
+        margin-top: 10px;
+        font-weight: 400;
+    }
+    
+    .kpi-card-modern {
+        background: linear-gradient(135deg, """ + CEFET_PURPLE + """ 0%, #8B7AB8 100%);
+        padding: 30px;
+        border-radius: 20px;
+        box-shadow: 0 8px 24px rgba(0,0,0,0.12);
+        transition: all 0.3s ease;
+        position: relative;
+        overflow: hidden;
+        margin-bottom: 20px;
+    }
+    
+    .kpi-card-modern::before {
+        content: '';
+        position: absolute;
+        top: -50%;
+        right: -20%;
+        width: 200px;
+        height: 200px;
+        background: rgba(255,255,255,0.1);
+        border-radius: 50%;
+    }
+    
+    .kpi-card-modern:hover {
+        transform: translateY(-5px);
+        box-shadow: 0 12px 32px rgba(0,0,0,0.18);
+    }
+    
+    .content-card {
+        background: white;
+        padding: 25px;
+        border-radius: 16px;
+        box-shadow: 0 4px 16px rgba(0,0,0,0.08);
+        margin-bottom: 20px;
+        border: 1px solid rgba(0,0,0,0.05);
+    }
+    
+    .content-card h3 {
+        color: """ + CEFET_DARK_BLUE + """;
+        font-size: 20px;
+        font-weight: 600;
+        margin-bottom: 20px;
+    }
+    
+    section[data-testid="stSidebar"] {
+        background: linear-gradient(180deg, """ + CEFET_BLUE + """ 0%, """ + CEFET_DARK_BLUE + """ 100%);
+    }
+    
+    section[data-testid="stSidebar"] .stMarkdown {
+        color: white;
+    }
+    
+    section[data-testid="stSidebar"] label {
+        color: white !important;
+        font-weight: 600 !important;
+    }
+    
+    section[data-testid="stSidebar"] p {
+        color: white !important;
+    }
+    
+    .stButton > button {
+        background: linear-gradient(135deg, """ + CEFET_BLUE + """ 0%, """ + CEFET_DARK_BLUE + """ 100%);
+        color: white;
+        border: none;
+        border-radius: 10px;
+        padding: 12px 24px;
+        font-weight: 600;
+        transition: all 0.3s ease;
+    }
+    
+    .stButton > button:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 8px 16px rgba(0,0,0,0.2);
+    }
+</style>
+"""
+
+HEADER_HTML = """
+<div class="header-gradient">
+    <h1>🎓 Dashboard CEFET-MG</h1>
+    <p>Análise de Dados de Pesquisa Institucional</p>
+</div>
+"""
+
+WELCOME_HTML = """
+<div class="content-card">
+    <h3>👋 Bem-vindo ao Dashboard CEFET-MG</h3>
+    <p>Este dashboard permite visualizar e analisar os dados da pesquisa institucional do CEFET-MG.</p>
+    <p><strong>Para começar:</strong></p>
+    <ol>
+        <li>Faça upload do arquivo Excel ou CSV na barra lateral</li>
+        <li>Explore os gráficos e análises gerados automaticamente</li>
+        <li>Use os filtros para segmentar os dados</li>
+    </ol>
+</div>
+"""
+
+FOOTER_HTML = """
+<div style='text-align: center; color: #6C757D; padding: 20px;'>
+    <p>Dashboard CEFET-MG | Desenvolvido com Streamlit</p>
+</div>
+"""
+
+# Estilo do relatório estático (HTML autocontido, sem fontes ou arquivos externos)
+REPORT_CSS = """
+body {
+    font-family: -apple-system, 'Segoe UI', Roboto, Helvetica, Arial, sans-serif;
+    margin: 0 auto;
+    max-width: 1200px;
+    padding: 24px;
+    color: #2a3f5f;
+    background: #f8f9fa;
+}
+
+header {
+    background: linear-gradient(135deg, """ + CEFET_BLUE + """ 0%, """ + CEFET_DARK_BLUE + """ 100%);
+    color: white;
+    padding: 32px 40px;
+    border-radius: 20px;
+    margin-bottom: 24px;
+}
+
+header h1 {
+    margin: 0;
+    font-size: 36px;
+}
+
+header p {
+    margin: 8px 0 0;
+    opacity: 0.95;
+}
+
+details {
+    background: white;
+    border-radius: 12px;
+    padding: 12px 24px;
+    margin-bottom: 16px;
+    box-shadow: 0 2px 8px rgba(0,0,0,0.08);
+}
+
+summary {
+    cursor: pointer;
+    font-size: 22px;
+    font-weight: 600;
+    color: """ + CEFET_BLUE + """;
+    padding: 8px 0;
+}
+
+h3 {
+    color: """ + CEFET_BLUE + """;
+    border-left: 4px solid """ + CEFET_LIGHT_BLUE + """;
+    padding-left: 12px;
+    margin-top: 32px;
+}
+"""
@@ -0,0 +1,627 @@
+"""Seções do dashboard: filtros, KPIs e gráficos a partir do conjunto pré-processado."""
+import hashlib
+import io
+import os
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from .aggregates import (
+    ANO_INGRESSO, LIKERT_COLORS, LIKERT_LABELS, RATING_COLORS, RATING_LEVELS, SCORE_LEVELS,
+    SEGMENT_DIMENSIONS, SEGMENT_NAMES, TIMELINE_PERIODS, catalog_columns, column_label,
+    column_values, combine_filters, count_values, cube_counts, cube_scores, filter_key,
+    likert_summary, option_cooccurrence, option_counts, rating_counts, timeline_counts,
+)
+from .charts import (
+    PAYLOAD_MAX_BYTES, create_cohort_chart, create_cooccurrence_chart, create_count_bar_chart,
+    create_infrastructure_chart, create_likert_chart, create_likert_overview_chart,
+    create_pie_chart, create_segment_comparison_chart, create_segment_heatmap,
+    create_timeline_chart, measured_figure,
+)
+from .data import (
+    CURSO_COL, DATA_COL, EMPREEND_LIKERT_COLUMNS, EMPREEND_NEGOCIO_COL, ENSINO_COL, EVASAO_COL,
+    IDADE_COL, INTERNET_DISP_COL, INTERNET_VEL_COL, PERMANENCIA_COL, PROJETOS_COL, SOCIO_COL,
+    format_bytes,
+)
+from .profiling import instrumented_cache, profile_local, profile_stage
+from .style import CEFET_BLUE, CEFET_GREEN, CEFET_LIGHT_BLUE, CEFET_ORANGE, CEFET_PURPLE, CEFET_RED
+
+# Número máximo de figuras mantidas em cache (compartilhado entre sessões)
+FIGURE_CACHE_ENTRIES = int(os.environ.get('CEFET_FIGURE_CACHE_ENTRIES', '256'))
+
+@instrumented_cache('cached_figure', st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES, show_spinner=False))
+def cached_figure(key, _build):
+    """Figura construída uma única vez por chave (hash do dataset, gráfico e parâmetros)"""
+    return _build()
+
+def show_figure(dataset, key, build):
+    """Exibe a figura em cache, construindo-a apenas na primeira vez"""
+    fig, size = cached_figure((dataset['digest'], dataset['filter_key']) + key, lambda: measured_figure(build()))
+    if fig is None:
+        return
+    enviado = getattr(profile_local, 'payload', 0)
+    if PAYLOAD_MAX_BYTES and enviado + size > PAYLOAD_MAX_BYTES:
+        botao = 'carregar_' + hashlib.md5(repr(key).encode()).hexdigest()
+        # Caixa de seleção: o gráfico liberado continua visível nas próximas execuções
+        if not st.checkbox(f"Carregar gráfico ({format_bytes(size)})", key=botao):
+            st.caption("⚠️ Gráfico não enviado: limite de dados por execução atingido.")
+            return
+    profile_local.payload = enviado + size
+    # Inclui a serialização da figura para o navegador
+    with profile_stage('plotly_chart'):
+        st.plotly_chart(fig, use_container_width=True)
+
+# Construtores das figuras, compartilhados pelas seções e pelo relatório estático (report.py)
+def count_figure(dataset, col, build):
+    """Gráfico de contagens (filtradas) de uma coluna categórica"""
+    return build(count_values(dataset['aggregates'], col, dataset['mask']))
+
+def option_figure(dataset, col, build):
+    """Gráfico de contagens por opção de uma coluna de múltipla escolha"""
+    return build(option_counts(dataset['options'][col], dataset['mask']))
+
+def likert_figure(dataset, column, title):
+    """Gráfico Likert de uma coluna"""
+    return create_likert_chart(dataset['likert'], column, title, dataset['mask'])
+
+def likert_overview_figure(dataset, columns, title):
+    """Visão geral de várias questões Likert em uma única figura"""
+    catalog = dataset['catalog']
+    labels = {col: column_label(catalog, col) for col in columns}
+    return create_likert_overview_chart(likert_summary(dataset['likert'], columns, dataset['mask']), labels, title)
+
+def infrastructure_figure(dataset, section, title):
+    """Gráfico empilhado de uma seção de avaliação"""
+    catalog = dataset['catalog']
+    columns = catalog_columns(catalog, section=section)
+    if dataset['mask'] is None:
+        counts = dataset['ratings'].loc[columns]
+    else:
+        counts = rating_counts(dataset['rating_codes'], columns, dataset['mask'])
+    counts = counts.rename(index=lambda col: column_label(catalog, col))
+    return create_infrastructure_chart(counts, title)
+
+def cooccurrence_figure(dataset):
+    """Participação simultânea nos projetos"""
+    return create_cooccurrence_chart(
+        option_cooccurrence(dataset['options'][PROJETOS_COL], dataset['mask']), 'Participação Simultânea em Projetos'
+    )
+
+def course_chart(counts):
+    """Top 15 cursos por número de respostas"""
+    return create_count_bar_chart(counts.head(15), 'Top 15 Cursos com Mais Respostas', 'Curso', ['#003366', '#4A90E2'])
+
+def age_chart(counts):
+    """Distribuição de idade dos respondentes"""
+    return create_count_bar_chart(
+        counts.sort_index(),
+        'Distribuição de Idade dos Respondentes', 'Idade', ['#003366', '#4A90E2'],
+        horizontal=False, height=400
+    )
+
+def teaching_chart(counts):
+    """Modelos de ensino vivenciados"""
+    return create_pie_chart(counts, 'Modelos de Ensino', [CEFET_BLUE, CEFET_LIGHT_BLUE, CEFET_PURPLE, CEFET_GREEN])
+
+def business_chart(counts):
+    """Empreendedorismo é abrir o próprio negócio?"""
+    return create_pie_chart(counts, 'Empreendedorismo é abrir o próprio negócio?', [CEFET_GREEN, CEFET_RED], height=350)
+
+def partner_chart(counts):
+    """Sócios ou fundadores de empresa"""
+    return create_pie_chart(
+        counts, 'É sócio ou fundador de empresa?',
+        [CEFET_BLUE, CEFET_LIGHT_BLUE, CEFET_PURPLE, CEFET_ORANGE], height=350
+    )
+
+def projects_chart(counts):
+    """Top 10 projetos com maior participação"""
+    return create_count_bar_chart(
+        counts.head(10),
+        'Top 10 Projetos com Maior Participação', 'Projeto', ['#003366', '#28A745'], height=400
+    )
+
+def permanence_chart(counts):
+    """Motivos de permanência"""
+    return create_count_bar_chart(counts.head(10), 'Motivos de Permanência', 'Motivo', ['#003366', '#28A745'])
+
+def dropout_chart(counts):
+    """Motivos de evasão"""
+    return create_count_bar_chart(counts.head(10), 'Motivos de Evasão', 'Motivo', ['#DC3545', '#FD7E14'])
+
+def show_count_chart(dataset, key, col, build):
+    """Exibe um gráfico de contagens (filtradas) de uma coluna categórica"""
+    show_figure(dataset, key, lambda: count_figure(dataset, col, build))
+
+def show_option_chart(dataset, key, col, build):
+    """Exibe um gráfico de contagens por opção de uma coluna de múltipla escolha"""
+    show_figure(dataset, key, lambda: option_figure(dataset, col, build))
+
+def show_likert_chart(dataset, column, title):
+    """Exibe o gráfico Likert de uma coluna usando o cache de figuras"""
+    show_figure(dataset, ('likert', column, title), lambda: likert_figure(dataset, column, title))
+
+def show_likert_overview(dataset, columns, title):
+    """Exibe a visão geral de várias questões Likert em uma única figura"""
+    show_figure(dataset, ('likert_overview', title), lambda: likert_overview_figure(dataset, columns, title))
+
+def show_infrastructure_chart(dataset, section, title):
+    """Exibe o gráfico empilhado de uma seção de avaliação usando o cache de figuras"""
+    show_figure(dataset, ('rating', section, title), lambda: infrastructure_figure(dataset, section, title))
+
+# Visão geral (todas as questões em uma figura) ou uma questão por vez
+LIKERT_VIEW_MODES = ['Visão geral', 'Questão individual']
+
+def render_visao_geral(dataset):
+    """Seção: Visão Geral"""
+    aggregates = dataset['aggregates']
+    
+    st.markdown('<div class="content-card"><h3>Distribuição por Curso</h3></div>', unsafe_allow_html=True)
+    if CURSO_COL in aggregates:
+        show_count_chart(dataset, ('curso',), CURSO_COL, course_chart)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown('<div class="content-card"><h3>Distribuição por Idade</h3></div>', unsafe_allow_html=True)
+        if IDADE_COL in aggregates:
+            show_count_chart(dataset, ('idade',), IDADE_COL, age_chart)
+    
+    with col2:
+        st.markdown('<div class="content-card"><h3>Tipo de Ensino Vivenciado</h3></div>', unsafe_allow_html=True)
+        if ENSINO_COL in aggregates:
+            show_count_chart(dataset, ('ensino',), ENSINO_COL, teaching_chart)
+
+def render_empreendedorismo(dataset):
+    """Seção: Empreendedorismo"""
+    catalog = dataset['catalog']
+    aggregates = dataset['aggregates']
+    
+    st.markdown('<div class="content-card"><h3>Percepções sobre Empreendedorismo</h3></div>', unsafe_allow_html=True)
+    
+    for col in EMPREEND_LIKERT_COLUMNS:
+        if col in catalog['columns']:
+            show_likert_chart(dataset, col, col.replace('"', ''))
+    
+    st.markdown('<div class="content-card"><h3>Entendimento sobre Empreendedorismo</h3></div>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if EMPREEND_NEGOCIO_COL in aggregates:
+            show_count_chart(dataset, ('empreend_negocio',), EMPREEND_NEGOCIO_COL, business_chart)
+    
+    with col2:
+        if SOCIO_COL in aggregates:
+            show_count_chart(dataset, ('socio',), SOCIO_COL, partner_chart)
+
+def render_perfil_alunos(dataset):
+    """Seção: Perfil dos Alunos"""
+    catalog = dataset['catalog']
+    options = dataset['options']
+    
+    st.markdown('<div class="content-card"><h3>Características dos Alunos</h3></div>', unsafe_allow_html=True)
+    
+    alunos_cols = catalog_columns(catalog, section='alunos', type='likert')
+    
+    if alunos_cols:
+        modo = st.radio('Visualização', LIKERT_VIEW_MODES, horizontal=True, key='modo_alunos')
+        
+        if modo == LIKERT_VIEW_MODES[0]:
+            show_likert_overview(dataset, alunos_cols, 'Características dos Alunos')
+        else:
+            selected_aluno_col = st.selectbox(
+                'Selecione a característica para visualizar:',
+                alunos_cols,
+                format_func=lambda x: column_label(catalog, x)
+            )
+            
+            show_likert_chart(dataset, selected_aluno_col, column_label(catalog, selected_aluno_col))
+    
+    st.markdown('<div class="content-card"><h3>Participação em Projetos</h3></div>', unsafe_allow_html=True)
+    
+    if PROJETOS_COL in options:
+        show_option_chart(dataset, ('projetos',), PROJETOS_COL, projects_chart)
+        show_figure(dataset, ('projetos_coocorrencia',), lambda: cooccurrence_figure(dataset))
+
+def render_infraestrutura(dataset):
+    """Seção: Infraestrutura"""
+    catalog = dataset['catalog']
+    
+    st.markdown('<div class="content-card"><h3>Avaliação da Infraestrutura</h3></div>', unsafe_allow_html=True)
+    
+    if catalog_columns(catalog, section='infraestrutura'):
+        show_infrastructure_chart(dataset, 'infraestrutura', 'Avaliação da Infraestrutura')
+    
+    st.markdown('<div class="content-card"><h3>Acessibilidade</h3></div>', unsafe_allow_html=True)
+    
+    if catalog_columns(catalog, section='acessibilidade'):
+        show_infrastructure_chart(dataset, 'acessibilidade', 'Avaliação da Acessibilidade')
+    
+    st.markdown('<div class="content-card"><h3>Qualidade da Internet</h3></div>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if INTERNET_DISP_COL in catalog['columns']:
+            show_likert_chart(dataset, INTERNET_DISP_COL, 'Disponibilidade de Internet')
+    
+    with col2:
+        if INTERNET_VEL_COL in catalog['columns']:
+            show_likert_chart(dataset, INTERNET_VEL_COL, 'Velocidade da Internet')
+
+# Grupos de questões comparáveis entre segmentos: (seção do catálogo, tipo)
+SEGMENT_GROUPS = {
+    'Empreendedorismo': ('empreendedorismo', 'likert'),
+    'Características dos Alunos': ('alunos', 'likert'),
+    'Características dos Professores': ('professores', 'likert'),
+    'Internet': ('internet', 'likert'),
+    'Infraestrutura': ('infraestrutura', 'rating'),
+    'Acessibilidade': ('acessibilidade', 'rating'),
+}
+# Segmentos (e células) com menos respostas que isso não são exibidos
+MIN_SEGMENT_RESPONSES = 5
+
+def segment_order(dim, labels, totals):
+    """Segmentos com respostas suficientes: cursos por volume, anos em ordem cronológica"""
+    keep = np.flatnonzero(totals >= MIN_SEGMENT_RESPONSES)
+    if dim == ANO_INGRESSO:
+        return keep[np.argsort(np.asarray(labels)[keep], kind='stable')]
+    return keep[np.argsort(-totals[keep], kind='stable')]
+
+def segment_names(dim, labels):
+    """Rótulos de exibição dos segmentos"""
+    if dim == ANO_INGRESSO:
+        return [str(int(label)) for label in labels]
+    return [str(label) for label in labels]
+
+def segment_groups(dataset):
+    """Dimensões disponíveis e grupos de questões com dados para comparar"""
+    catalog = dataset['catalog']
+    cubes = dataset['cubes']
+    dims = [dim for dim in SEGMENT_DIMENSIONS if dim in cubes['dims']]
+    groups = {
+        name: [col for col in catalog_columns(catalog, section=section, type=type) if col in cubes['columns']]
+        for name, (section, type) in SEGMENT_GROUPS.items()
+    }
+    return dims, {name: cols for name, cols in groups.items() if cols}
+
+def segment_counts(dataset, dim):
+    """Cubo de uma dimensão (recontado se houver filtros) nos segmentos exibidos, com seus rótulos"""
+    labels = dataset['cubes']['dims'][dim]['segments']['labels']
+    counts = cube_counts(dataset, dim)
+    order = segment_order(dim, labels, counts[:, 0, :].sum(axis=1))
+    return counts[order], segment_names(dim, labels[order])
+
+def segment_heatmap_figure(dataset, dim, group, columns, counts, names):
+    """Mapa de calor da nota média por segmento para um grupo de questões"""
+    catalog = dataset['catalog']
+    scores, total = cube_scores(counts[:, dataset['cubes']['columns'].get_indexer(columns)])
+    if not len(names):
+        return None
+    scores = np.where(total >= MIN_SEGMENT_RESPONSES, scores, np.nan)
+    scores = pd.DataFrame(scores, index=names, columns=[column_label(catalog, col) for col in columns])
+    return create_segment_heatmap(scores, f'Nota Média por {SEGMENT_NAMES[dim]} - {group}')
+
+def render_segmentos(dataset):
+    """Seção: Comparação por Segmento"""
+    catalog = dataset['catalog']
+    cubes = dataset['cubes']
+    dims, groups = segment_groups(dataset)
+    
+    st.markdown('<div class="content-card"><h3>Comparação por Segmento</h3></div>', unsafe_allow_html=True)
+    
+    if not dims or not groups:
+        st.info("Os dados não têm cursos, anos de ingresso ou questões de escala para comparar.")
+        return
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        dim = st.radio('Segmentar por', dims, format_func=SEGMENT_NAMES.get, horizontal=True)
+    
+    with col2:
+        group = st.selectbox('Grupo de questões', list(groups))
+    
+    columns = groups[group]
+    cache = {}
+    
+    def sliced():
+        # O cubo (recontado uma vez se houver filtros) é apenas fatiado nos gráficos
+        if 'counts' not in cache:
+            cache['counts'] = segment_counts(dataset, dim)
+        return cache['counts']
+    
+    show_figure(dataset, ('segment_heatmap', dim, group), lambda: segment_heatmap_figure(
+        dataset, dim, group, columns, *sliced()
+    ))
+    
+    question = st.selectbox(
+        'Selecione a questão para comparar os segmentos:',
+        columns,
+        format_func=lambda x: column_label(catalog, x)
+    )
+    
+    def build_comparison():
+        counts, names = sliced()
+        valid = counts[:, cubes['columns'].get_loc(question), 1:]
+        total = valid.sum(axis=1)
+        keep = total >= MIN_SEGMENT_RESPONSES
+        if not keep.any():
+            return None
+        shares = pd.DataFrame(
+            valid[keep] / total[keep, None],
+            index=np.asarray(names)[keep],
+            columns=range(1, SCORE_LEVELS)
+        )
+        if catalog['columns'][question]['type'] == 'rating':
+            level_labels = {level: RATING_LEVELS[SCORE_LEVELS - 1 - level] for level in shares.columns}
+            colors = {level: RATING_COLORS[name] for level, name in level_labels.items()}
+        else:
+            level_labels, colors = LIKERT_LABELS, LIKERT_COLORS
+        return create_segment_comparison_chart(shares, column_label(catalog, question), level_labels, colors)
+    
+    show_figure(dataset, ('segment_comparison', dim, question), build_comparison)
+
+def timeline_data(dataset):
+    """Contagens por período e por coorte: pré-agregadas, ou recontadas a partir dos códigos de dia"""
+    timeline = dataset['timeline']
+    if dataset['mask'] is None:
+        return timeline['counts'], timeline['cohort_counts']
+    return timeline_counts(timeline, dataset['mask'])
+
+def cohort_totals_chart(cohort_counts):
+    """Respondentes por ano de ingresso"""
+    return create_count_bar_chart(
+        cohort_counts.sum().rename(index=str),
+        'Respondentes por Ano de Ingresso', 'Ano de ingresso', ['#003366', '#4A90E2'],
+        horizontal=False, height=450
+    )
+
+def render_linha_do_tempo(dataset):
+    """Seção: Linha do Tempo"""
+    timeline = dataset['timeline']
+    
+    st.markdown('<div class="content-card"><h3>Respostas ao Longo do Tempo</h3></div>', unsafe_allow_html=True)
+    
+    if timeline is None:
+        st.info("Os dados não têm datas de resposta válidas.")
+        return
+    
+    cache = {}
+    
+    def counts():
+        # Com filtros, recontadas uma única vez para todos os gráficos da seção
+        if 'counts' not in cache:
+            cache['counts'] = timeline_data(dataset)
+        return cache['counts']
+    
+    periodo = st.radio('Agregação', list(TIMELINE_PERIODS), index=2, horizontal=True)
+    freq = TIMELINE_PERIODS[periodo]
+    show_figure(dataset, ('timeline', freq), lambda: create_timeline_chart(
+        counts()[0][freq], f'Respostas por Período ({periodo})'
+    ))
+    
+    if timeline['cohorts'] is None:
+        return
+    
+    st.markdown('<div class="content-card"><h3>Coortes por Ano de Ingresso</h3></div>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        show_figure(dataset, ('coortes',), lambda: cohort_totals_chart(counts()[1]))
+    
+    with col2:
+        show_figure(dataset, ('coortes_mensal',), lambda: create_cohort_chart(
+            counts()[1], 'Respostas por Mês e Ano de Ingresso'
+        ))
+
+def render_analises_detalhadas(dataset):
+    """Seção: Análises Detalhadas"""
+    catalog = dataset['catalog']
+    options = dataset['options']
+    
+    st.markdown('<div class="content-card"><h3>Motivos de Permanência e Evasão</h3></div>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if PERMANENCIA_COL in options:
+            show_option_chart(dataset, ('permanencia',), PERMANENCIA_COL, permanence_chart)
+    
+    with col2:
+        if EVASAO_COL in options:
+            show_option_chart(dataset, ('evasao',), EVASAO_COL, dropout_chart)
+    
+    st.markdown('<div class="content-card"><h3>Características dos Professores</h3></div>', unsafe_allow_html=True)
+    
+    prof_cols = catalog_columns(catalog, section='professores', type='likert')
+    
+    if prof_cols:
+        modo = st.radio('Visualização', LIKERT_VIEW_MODES, horizontal=True, key='modo_professores')
+        
+        if modo == LIKERT_VIEW_MODES[0]:
+            show_likert_overview(dataset, prof_cols, 'Características dos Professores')
+        else:
+            selected_prof_col = st.selectbox(
+                'Selecione a característica dos professores para visualizar:',
+                prof_cols,
+                format_func=lambda x: column_label(catalog, x)
+            )
+            
+            show_likert_chart(dataset, selected_prof_col, column_label(catalog, selected_prof_col))
+    
+    st.markdown('<div class="content-card"><h3>Dados Brutos</h3></div>', unsafe_allow_html=True)
+    
+    if st.checkbox('Mostrar dados brutos'):
+        render_raw_data(dataset)
+
+RAW_PAGE_SIZES = [25, 50, 100, 250]
+RAW_DEFAULT_COLUMNS = 10
+
+EXPORT_FORMATS = {
+    'CSV': ('dados_cefet_mg.csv', 'text/csv'),
+    'CSV (gzip)': ('dados_cefet_mg.csv.gz', 'application/gzip'),
+    'Parquet': ('dados_cefet_mg.parquet', 'application/octet-stream'),
+}
+
+@instrumented_cache('export_data', st.cache_data(max_entries=4, show_spinner="Preparando arquivo..."))
+def export_data(digest, filter_key, fmt, _df, _mask):
+    """Serializa os dados filtrados no formato pedido (gerado sob demanda, em cache)"""
+    df = _df if _mask is None else _df[_mask]
+    buffer = io.BytesIO()
+    if fmt == 'Parquet':
+        df.to_parquet(buffer, index=False)
+    elif fmt == 'CSV (gzip)':
+        df.to_csv(buffer, index=False, encoding='utf-8', compression='gzip')
+    else:
+        df.to_csv(buffer, index=False, encoding='utf-8')
+    return buffer.getvalue()
+
+def render_raw_data(dataset):
+    """Visualização paginada dos dados brutos; envia apenas a página e as colunas visíveis"""
+    df = dataset['df']
+    catalog = dataset['catalog']
+    mask = dataset['mask']
+    rows = np.arange(len(df)) if mask is None else np.flatnonzero(mask)
+    
+    columns = st.multiselect(
+        'Colunas exibidas',
+        list(df.columns),
+        default=list(df.columns[:RAW_DEFAULT_COLUMNS]),
+        format_func=lambda x: column_label(catalog, x)
+    )
+    col1, col2 = st.columns(2)
+    with col1:
+        page_size = st.selectbox('Linhas por página', RAW_PAGE_SIZES, index=1)
+    pages = max((len(rows) - 1) // page_size + 1, 1)
+    with col2:
+        page = st.number_input(f'Página (de {pages})', min_value=1, max_value=pages, value=1, step=1)
+    
+    start = (page - 1) * page_size
+    st.dataframe(df.iloc[rows[start:start + page_size]][columns], use_container_width=True)
+    st.caption(f"Linhas {start + 1 if len(rows) else 0}–{min(start + page_size, len(rows))} de {len(rows):,}")
+    
+    # Botão de download: o arquivo só é gerado quando solicitado
+    fmt = st.radio('Formato', list(EXPORT_FORMATS), horizontal=True)
+    export_key = (dataset['digest'], dataset['filter_key'], fmt)
+    if st.button('Preparar download'):
+        st.session_state['export_key'] = export_key
+    if st.session_state.get('export_key') == export_key:
+        file_name, mime = EXPORT_FORMATS[fmt]
+        st.download_button(
+            label=f"📥 Baixar dados em {fmt}",
+            data=export_data(*export_key, df, mask),
+            file_name=file_name,
+            mime=mime,
+        )
+
+def render_filters(index):
+    """Filtros da barra lateral; retorna as seleções ativas (coluna -> valores)"""
+    selections = {}
+    st.markdown("### 🔎 Filtros")
+    
+    if CURSO_COL in index:
+        cursos = st.multiselect('Curso', sorted(index[CURSO_COL], key=str))
+        if cursos:
+            selections[CURSO_COL] = cursos
+    
+    for key, label in [(IDADE_COL, 'Faixa etária'), (ANO_INGRESSO, 'Ano de ingresso')]:
+        values = sorted(index.get(key, []))
+        if len(values) > 1:
+            lo, hi = st.slider(label, int(values[0]), int(values[-1]), (int(values[0]), int(values[-1])))
+            if (lo, hi) != (int(values[0]), int(values[-1])):
+                selections[key] = [v for v in values if lo <= v <= hi]
+    
+    for col, label in [(ENSINO_COL, 'Modelo de ensino'), (SOCIO_COL, 'Sócio(a) ou fundador(a) de empresa')]:
+        if col in index:
+            selected = st.multiselect(label, sorted(index[col], key=str))
+            if selected:
+                selections[col] = selected
+    
+    return selections
+
+def render_kpis(dataset):
+    """KPIs principais, calculados apenas sobre as linhas filtradas"""
+    df = dataset['df']
+    mask = dataset['mask']
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown('<div class="kpi-card-modern">', unsafe_allow_html=True)
+        total = len(df) if mask is None else int(mask.sum())
+        st.metric("Total de Respostas", f"{total:,}")
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown('<div class="kpi-card-modern">', unsafe_allow_html=True)
+        idade_media = column_values(dataset, IDADE_COL).mean() if IDADE_COL in df.columns else None
+        if pd.notna(idade_media):
+            st.metric("Idade Média", f"{idade_media:.1f} anos")
+        else:
+            st.metric("Idade Média", "N/A")
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown('<div class="kpi-card-modern">', unsafe_allow_html=True)
+        if CURSO_COL in dataset['aggregates']:
+            cursos_unicos = len(count_values(dataset['aggregates'], CURSO_COL, mask))
+            st.metric("Cursos Diferentes", f"{cursos_unicos}")
+        else:
+            st.metric("Cursos Diferentes", "N/A")
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown('<div class="kpi-card-modern">', unsafe_allow_html=True)
+        datas = column_values(dataset, DATA_COL) if DATA_COL in df.columns else None
+        if datas is not None and datas.notna().any():
+            periodo = f"{datas.min().strftime('%m/%Y')} - {datas.max().strftime('%m/%Y')}"
+            st.metric("Período", periodo)
+        else:
+            st.metric("Período", "N/A")
+        st.markdown('</div>', unsafe_allow_html=True)
+
+# Seções do dashboard: apenas a seção ativa é renderizada a cada execução
+SECTIONS = {
+    "📊 Visão Geral": render_visao_geral,
+    "🎯 Empreendedorismo": render_empreendedorismo,
+    "👥 Perfil dos Alunos": render_perfil_alunos,
+    "🏢 Infraestrutura": render_infraestrutura,
+    "🔍 Segmentos": render_segmentos,
+    "📅 Linha do Tempo": render_linha_do_tempo,
+    "📈 Análises Detalhadas": render_analises_detalhadas,
+}
+
+def render_dashboard(dataset):
+    """Filtros, KPIs e seção ativa para um conjunto pré-processado"""
+    # Cópia rasa: o conjunto em cache é compartilhado e não deve ser alterado
+    dataset = dict(dataset)
+    
+    with st.sidebar:
+        memoria = dataset['df'].attrs.get('memory_usage')
+        if memoria:
+            st.caption(f"💾 Memória: {format_bytes(memoria['antes'])} → {format_bytes(memoria['depois'])}")
+        if dataset['waves'] > 1:
+            st.caption(f"🌊 {dataset['waves']} ondas · {dataset['duplicates']:,} respostas duplicadas ignoradas")
+        selections = render_filters(dataset['filters'])
+    
+    dataset['mask'] = combine_filters(dataset['filters'], selections)
+    dataset['filter_key'] = filter_key(selections)
+    
+    render_kpis(dataset)
+    
+    if dataset['mask'] is not None and not dataset['mask'].any():
+        st.warning("Nenhuma resposta corresponde aos filtros selecionados.")
+    else:
+        # Seção ativa (st.tabs executaria todas as seções a cada interação)
+        secao = st.radio(
+            'Seção',
+            list(SECTIONS),
+            horizontal=True,
+            key='secao',
+            label_visibility='collapsed'
+        )
+        with profile_stage('render:' + secao):
+            SECTIONS[secao](dataset)
@@ -0,0 +1,88 @@
+"""Pré-processa as planilhas da pesquisa e grava um snapshot para o dashboard.
+
+Uso:
+    python precompute.py dados.xlsx [onda2.xlsx ...] -o dashboard.snapshot
+
+Depois, inicie o dashboard apontando para o snapshot gerado:
+    CEFET_SNAPSHOT=dashboard.snapshot streamlit run streamlit_app.py
+
+Para compartilhar os resultados sem o dashboard, gere também o relatório estático:
+    python precompute.py dados.xlsx -o dashboard.snapshot --report relatorio.html --report-courses
+"""
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+from cefet_dashboard.aggregates import build_dataset, combined_digest, merge_wave, write_snapshot
+from cefet_dashboard.data import file_digest, format_bytes, ingest_file
+
+class ConsoleProgress:
+    """Mostra o progresso da leitura no terminal (mesma interface de st.progress)"""
+    
+    def __init__(self, name):
+        self.name = name
+    
+    def progress(self, value, text=None):
+        print(f"\r{self.name}: {value:.0%}", end='', file=sys.stderr, flush=True)
+
+def open_file(path):
+    """Abre o arquivo como o objeto em memória que o upload do Streamlit fornece"""
+    path = Path(path)
+    buffer = io.BytesIO(path.read_bytes())
+    buffer.name = path.name
+    return buffer
+
+def build_snapshot(paths, quiet=False):
+    """Processa as ondas em ordem, como o dashboard faz com vários uploads"""
+    dataset = None
+    digests = []
+    for path in paths:
+        file = open_file(path)
+        progress = None if quiet else ConsoleProgress(Path(path).name)
+        df = ingest_file(file, progress)
+        if not quiet:
+            print(file=sys.stderr)
+        digests.append(file_digest(file))
+        digest = combined_digest(tuple(digests))
+        if dataset is None:
+            dataset = build_dataset(digest, df)
+        else:
+            dataset = merge_wave(dataset, digest, df)
+    return dataset
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera um snapshot pré-processado do Dashboard CEFET-MG.")
+    parser.add_argument('inputs', nargs='+', help="Planilhas Excel ou CSV, em ordem de onda")
+    parser.add_argument('-o', '--output', default='dashboard.snapshot', help="Arquivo de saída (padrão: dashboard.snapshot)")
+    parser.add_argument('-q', '--quiet', action='store_true', help="Não mostra o progresso da leitura")
+    parser.add_argument('--report', help="Grava também o relatório estático (HTML autocontido)")
+    parser.add_argument('--report-courses', action='store_true', help="Inclui no relatório uma página por curso")
+    args = parser.parse_args(argv)
+    
+    inicio = time.perf_counter()
+    dataset = build_snapshot(args.inputs, quiet=args.quiet)
+    write_snapshot(dataset, args.output)
+    duracao = time.perf_counter() - inicio
+    
+    df = dataset['df']
+    print(f"Snapshot gravado em {args.output}")
+    print(f"  Respostas: {len(df):,} ({dataset['waves']} onda(s), {dataset['duplicates']:,} duplicadas ignoradas)")
+    print(f"  Colunas: {len(df.columns)} ({len(dataset['likert'].columns)} Likert)")
+    print(f"  Tamanho: {format_bytes(Path(args.output).stat().st_size)} em {duracao:.1f}s")
+    
+    if args.report:
+        inicio = time.perf_counter()
+        # O relatório importa o Plotly; só é carregado quando pedido
+        from cefet_dashboard.report import write_report
+        progress = None if args.quiet else ConsoleProgress(Path(args.report).name)
+        write_report(dataset, args.report, args.report_courses, progress)
+        if not args.quiet:
+            print(file=sys.stderr)
+        print(f"Relatório gravado em {args.report}")
+        print(f"  Tamanho: {format_bytes(Path(args.report).stat().st_size)} em {time.perf_counter() - inicio:.1f}s")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
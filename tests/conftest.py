@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Permite importar o pacote e os geradores de benchmark sem instalação
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,76 @@
+"""Testes dos agregados e das visões, sobre a pesquisa sintética"""
+import io
+
+from benchmarks.synthetic_survey import ALUNOS_PREFIXO, generate_survey
+from cefet_dashboard import data
+from cefet_dashboard.aggregates import build_dataset, catalog_columns, dataset_size, get_dataset, merge_wave
+from cefet_dashboard.data import IDADE_COL, compact_frame, frame_cache, ingest_file, load_data, memory_usage
+from cefet_dashboard.report import report_analises_detalhadas, report_perfil_alunos, segment_dataset
+from cefet_dashboard.views import likert_overview_figure
+
+def test_overview_ignores_non_likert_columns():
+    df = generate_survey(300)
+    # Opção "Outra" da grade de características: texto livre, sempre vazio
+    df[f'{ALUNOS_PREFIXO}Outra (especifique)'] = None
+    dataset = segment_dataset(build_dataset('overview', compact_frame(df)), None)
+    
+    columns = catalog_columns(dataset['catalog'], section='alunos', type='likert')
+    assert f'{ALUNOS_PREFIXO}Outra (especifique)' not in columns
+    assert likert_overview_figure(dataset, columns, 'Características dos Alunos') is not None
+    assert list(report_perfil_alunos(dataset))
+    assert list(report_analises_detalhadas(dataset))
+
+def ingest_csv(df, name):
+    """Lê o DataFrame pelo mesmo caminho de um upload .csv"""
+    buffer = io.BytesIO(df.to_csv(index=False).encode('utf-8'))
+    buffer.name = name
+    return ingest_file(buffer)
+
+def test_merge_wave_detects_duplicates_across_compacted_dtypes(tmp_path, monkeypatch):
+    monkeypatch.setattr(data, 'CACHE_DIR', tmp_path)
+    df = generate_survey(1000)
+    assert df[IDADE_COL].isna().any()
+    base = ingest_csv(df, 'base.csv')
+    # Segunda onda reenviando 200 respostas, todas com idade preenchida (exportada como inteiro)
+    repetidas = df[df[IDADE_COL].notna()].head(200).astype({IDADE_COL: int})
+    wave = ingest_csv(repetidas, 'onda2.csv')
+    assert base[IDADE_COL].dtype != wave[IDADE_COL].dtype
+    
+    merged = merge_wave(build_dataset('base', base), 'ondas', wave)
+    assert merged['duplicates'] == 200
+    assert len(merged['df']) == 1000
+    
+    # Questionário com uma coluna a mais: o conjunto é refeito, sem as respostas repetidas
+    nova = df.head(300).assign(**{'Pergunta nova': 'Sim'})
+    merged = merge_wave(build_dataset('base', base), 'ondas', ingest_csv(nova, 'onda3.csv'))
+    assert merged['duplicates'] == 300
+    assert len(merged['df']) == 1000
+    assert merged['waves'] == 2
+
+def test_get_dataset_is_charged_to_memory_budget():
+    cache = frame_cache()
+    cache.clear()
+    frames = [compact_frame(generate_survey(500, seed=seed)) for seed in (1, 2)]
+    for digest, frame in zip(['onda1', 'onda2'], frames):
+        cache.put(digest, frame, memory_usage(frame))
+    
+    dataset = get_dataset(('onda1', 'onda2'), frames)
+    assert get_dataset(('onda1', 'onda2'), frames) is dataset
+    sizes = {key: size for key, (_, size, _) in cache.entries.items()}
+    # O frame da primeira onda passa a ser contado (uma vez) dentro do conjunto dela
+    assert set(sizes) == {'onda2', ('dataset', ('onda1',)), ('dataset', ('onda1', 'onda2'))}
+    assert sizes[('dataset', ('onda1',))] > memory_usage(frames[0])
+    assert sizes[('dataset', ('onda1', 'onda2'))] > memory_usage(dataset['df'])
+    assert cache.size == sum(sizes.values())
+    # Sem o frame em memória, o carregamento reaproveita o df do conjunto em vez de reler o Parquet
+    assert load_data(None, 'onda1') is frames[0]
+    assert 'onda1' not in cache.entries
+    
+    # Orçamento menor que o conjunto: o LRU descarta os itens mais antigos
+    cache.max_bytes = dataset_size(dataset)
+    try:
+        cache.put(('dataset', ('onda1', 'onda2')), dataset, dataset_size(dataset))
+        assert list(cache.entries) == [('dataset', ('onda1', 'onda2'))]
+    finally:
+        cache.max_bytes = data.MEMORY_CACHE_MAX_BYTES
+        cache.clear()
@@ -0,0 +1,23 @@
+"""Testes da leitura em blocos e da compactação dos dados"""
+import io
+
+import pandas as pd
+
+from cefet_dashboard import data
+from cefet_dashboard.data import ingest_file
+
+def test_chunked_ingest_keeps_free_text_as_object(tmp_path, monkeypatch):
+    monkeypatch.setattr(data, 'CACHE_DIR', tmp_path)
+    rows = 5000
+    df = pd.DataFrame({
+        'Comentários': [f'Comentário livre número {i}' for i in range(rows)],
+        'Resposta': ['Sim', 'Não'] * (rows // 2),
+    })
+    buffer = io.BytesIO(df.to_csv(index=False).encode('utf-8'))
+    buffer.name = 'comentarios.csv'
+    
+    result = ingest_file(buffer)
+    assert result['Comentários'].dtype == object
+    assert isinstance(result['Resposta'].dtype, pd.CategoricalDtype)
+    memoria = result.attrs['memory_usage']
+    assert memoria['depois'] < memoria['antes']
@@ -0,0 +1,28 @@
+"""Testes do relatório estático em cache"""
+import os
+
+from benchmarks.synthetic_survey import generate_survey
+from cefet_dashboard import report
+from cefet_dashboard.aggregates import build_dataset
+from cefet_dashboard.data import compact_frame
+
+def test_cache_report_evicts_least_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setattr(report, 'REPORT_DIR', tmp_path)
+    monkeypatch.setattr(report, 'REPORT_MAX_BYTES', 12 * 1024 * 1024)
+    antigos = []
+    for i, name in enumerate(['a', 'b', 'c']):
+        path = tmp_path / f'{name}_geral_v{report.REPORT_FORMAT_VERSION}.html'
+        path.write_bytes(b'x' * 4 * 1024 * 1024)
+        os.utime(path, (1000 + i, 1000 + i))
+        antigos.append(path)
+    # Baixado por último: passa a ser o mais recente entre os antigos
+    report.touch_report(antigos[0])
+    
+    dataset = build_dataset('relatorio', compact_frame(generate_survey(200)))
+    path = report.cache_report(dataset, report.report_path(dataset['digest']))
+    
+    assert path.exists()
+    assert antigos[0].exists()
+    assert not antigos[1].exists()
+    assert sum(p.stat().st_size for p in tmp_path.glob('*.html')) <= report.REPORT_MAX_BYTES
+    assert report.read_report(antigos[1]) is None